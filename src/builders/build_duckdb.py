@@ -30,8 +30,9 @@ from typing import Optional
 
 import duckdb
 import pyarrow as pa
+import pyarrow.compute as pc
 
-from validators import validate_arrow_table
+from validators import ValidationLevel, validate_arrow_table
 
 from .base_builder import BuildError, DatabaseBuilder
 
@@ -231,12 +232,15 @@ class DuckDBBuilder(DatabaseBuilder):
         except Exception as e:
             raise BuildError(f"Parquet export failed: {e}") from e
 
-    def validate(self, database_file: Path) -> bool:
+    def validate(self, database_file: Path, level: ValidationLevel = "full") -> bool:
         """
         Validate built DuckDB database using comprehensive Schema V2 validation.
 
         Args:
             database_file: Path to .duckdb file
+            level: "full" runs all rules; "schema" checks only the column
+                   types, for a database just written by build() (which
+                   already ran full validation on the same rows)
 
         Returns:
             True if valid
@@ -267,15 +271,14 @@ class DuckDBBuilder(DatabaseBuilder):
             arrow_table = con.execute("SELECT * FROM rankings").fetch_arrow_table()
 
             # Comprehensive validation using shared validator
-            errors = validate_arrow_table(arrow_table)
+            errors = validate_arrow_table(arrow_table, level=level)
             if errors:
                 error_messages = "\n".join([f"  - {e}" for e in errors])
                 raise BuildError(f"Validation failed with {len(errors)} error(s):\n{error_messages}")
 
-            # Print summary
-            min_rank = con.execute("SELECT MIN(rank) FROM rankings").fetchone()[0]
-            max_rank = con.execute("SELECT MAX(rank) FROM rankings").fetchone()[0]
-            print(f"  Rank range: {min_rank} to {max_rank}")
+            # Print summary (computed on the Arrow table already in memory)
+            rank_bounds = pc.min_max(arrow_table["rank"]).as_py()
+            print(f"  Rank range: {rank_bounds['min']} to {rank_bounds['max']}")
 
             con.close()
 
@@ -7,6 +7,7 @@ Pattern copied from src/utils/checkpoint_manager.py (JSON caching patterns).
 GitHub Issue: https://github.com/terrylica/crypto-marketcap-rank/issues/1
 """
 
+import hashlib
 import json
 import logging
 from datetime import datetime, timedelta
@@ -15,6 +16,11 @@ from pathlib import Path
 from .exceptions import CacheError
 from .github_api import GitHubReleasesClient, ReleaseInfo
 
+try:
+    import orjson
+except ImportError:  # Optional: fall back to stdlib json
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -23,13 +29,35 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _dumps_line(obj: dict) -> bytes:
+    """Serialize one compact JSON Lines record (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, separators=(",", ":")) + "\n").encode()
+
+
+def _loads(data: bytes) -> dict:
+    """Parse JSON bytes (orjson.JSONDecodeError subclasses json.JSONDecodeError)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _file_sha256(path: Path) -> str:
+    """SHA-256 hex digest of a file (hashlib.file_digest streams it through OpenSSL)."""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
 class CacheManager:
     """Local cache for downloaded databases.
 
     Features:
-    - Atomic metadata writes (tmp + rename)
-    - JSON serialization for metadata
+    - Append-only JSON Lines metadata log (one record per mutation)
+    - Atomic compaction (tmp + rename) when the log outgrows live entries
+    - Reads legacy cache_metadata.json and migrates it on next write
     - Auto-invalidation after 7 days
+    - SHA-256 integrity check on cache hit (re-download on mismatch)
     - Manual invalidation support
 
     Usage:
@@ -38,18 +66,25 @@ class CacheManager:
     """
 
     DEFAULT_DIR = Path.home() / ".cache" / "crypto_marketcap_rank"
-    METADATA_FILE = "cache_metadata.json"
+    METADATA_FILE = "cache_metadata.jsonl"
+    LEGACY_METADATA_FILE = "cache_metadata.json"  # Pre-JSONL single-document format
     MAX_AGE_DAYS = 7  # Auto-invalidate after 7 days
+    COMPACT_RATIO = 4  # Rewrite log when records > 4x live entries
+    COMPACT_MIN_RECORDS = 32  # Never compact logs smaller than this
 
-    def __init__(self, cache_dir: Path | None = None):
+    def __init__(self, cache_dir: Path | None = None, verify: bool = True):
         """Initialize cache manager.
 
         Args:
             cache_dir: Custom cache directory. Defaults to ~/.cache/crypto_marketcap_rank/
+            verify: If True, check cached files against their recorded SHA-256
+                    before returning them. Set False in trusted environments.
         """
         self._dir = cache_dir or self.DEFAULT_DIR
+        self._verify = verify
         self._dir.mkdir(parents=True, exist_ok=True)
         self._metadata_path = self._dir / self.METADATA_FILE
+        self._log_records = 0  # Records in the on-disk log (live + superseded)
         self._metadata = self._load_metadata()
 
         logger.debug(f"Cache directory: {self._dir}")
@@ -59,12 +94,15 @@ class CacheManager:
         self,
         release: ReleaseInfo,
         force_refresh: bool = False,
+        client: GitHubReleasesClient | None = None,
     ) -> Path:
         """Get cached file or download if missing/stale.
 
         Args:
             release: ReleaseInfo with download details.
             force_refresh: If True, re-download even if cached.
+            client: Client to download with. Pass the client that fetched
+                    the release so the download reuses its pooled connection.
 
         Returns:
             Path to cached DuckDB file.
@@ -78,7 +116,7 @@ class CacheManager:
         # Check if cached and valid
         if not force_refresh and cached and self._is_valid(cached):
             cached_path = self._dir / cached["filename"]
-            if cached_path.exists():
+            if cached_path.exists() and self._is_intact(cached_path, cached):
                 logger.info(f"Cache hit: {cached_path.name}")
                 return cached_path
 
@@ -86,18 +124,21 @@ class CacheManager:
         logger.info(f"Cache miss: downloading {release.asset_name}")
 
         try:
-            client = GitHubReleasesClient()
+            if client is None:
+                client = GitHubReleasesClient()
             dest = self._dir / release.asset_name
             client.download_asset(release, dest)
 
-            # Update metadata atomically
-            self._metadata[cache_key] = {
+            # Record new entry (single appended line)
+            entry = {
                 "filename": release.asset_name,
                 "downloaded_at": datetime.now().isoformat(),
                 "size_bytes": release.size_bytes,
                 "tag": release.tag,
+                "sha256": _file_sha256(dest),
             }
-            self._save_metadata()
+            self._metadata[cache_key] = entry
+            self._append_metadata({"op": "add", "key": cache_key, "entry": entry})
 
             return dest
 
@@ -121,6 +162,7 @@ class CacheManager:
                     cached_file = self._dir / self._metadata[key]["filename"]
                     cached_file.unlink(missing_ok=True)
                     del self._metadata[key]
+                    self._append_metadata({"op": "del", "key": key})
                     logger.info(f"Invalidated: {release.tag}")
             else:
                 # Invalidate all
@@ -128,10 +170,9 @@ class CacheManager:
                     cached_file = self._dir / entry["filename"]
                     cached_file.unlink(missing_ok=True)
                 self._metadata = {}
+                self._save_metadata()
                 logger.info("Invalidated all cache entries")
 
-            self._save_metadata()
-
         except Exception as e:
             raise CacheError(f"Failed to invalidate cache: {e}") from e
 
@@ -147,27 +188,98 @@ class CacheManager:
         except (KeyError, ValueError):
             return False
 
+    def _is_intact(self, path: Path, entry: dict) -> bool:
+        """Check cached file against its recorded SHA-256 (entries without one are trusted)."""
+        expected = entry.get("sha256")
+        if not self._verify or expected is None:
+            return True
+        if _file_sha256(path) != expected:
+            logger.warning(f"Cache integrity check failed: {path.name}")
+            return False
+        return True
+
     def _load_metadata(self) -> dict:
-        """Load cache metadata from JSON file."""
-        if self._metadata_path.exists():
+        """Load cache metadata by replaying the JSON Lines log.
+
+        Malformed lines (e.g. a torn final write) are skipped with a warning,
+        and the next append compacts the log so they are dropped (and a new
+        record can never land on a torn line). Falls back to the legacy single-document
+        cache_metadata.json when no log exists yet.
+        """
+        if not self._metadata_path.exists():
+            return self._load_legacy_metadata()
+
+        try:
+            data = self._metadata_path.read_bytes()
+        except OSError as e:
+            logger.warning(f"Failed to load cache metadata: {e}")
+            return {}
+
+        metadata: dict = {}
+        damaged = bool(data) and not data.endswith(b"\n")
+        for line_no, line in enumerate(data.splitlines(), start=1):
+            if not line.strip():
+                continue
+            self._log_records += 1
+            try:
+                record = _loads(line)
+                if record["op"] == "add":
+                    metadata[record["key"]] = record["entry"]
+                elif record["op"] == "del":
+                    metadata.pop(record["key"], None)
+            except (json.JSONDecodeError, KeyError, TypeError) as e:
+                logger.warning(f"Skipping malformed cache metadata line {line_no}: {e}")
+                damaged = True
+
+        if damaged:
+            # Force a compaction on the first append (rewrite instead of appending to a torn tail)
+            self._log_records = self.COMPACT_MIN_RECORDS * self.COMPACT_RATIO
+        return metadata
+
+    def _load_legacy_metadata(self) -> dict:
+        """Load pre-JSONL cache_metadata.json (rewritten as JSONL on next save)."""
+        legacy_path = self._dir / self.LEGACY_METADATA_FILE
+        if legacy_path.exists():
             try:
-                with open(self._metadata_path) as f:
-                    return json.load(f)
+                metadata = _loads(legacy_path.read_bytes())
+                # Force a compaction on the first append so the log is seeded
+                self._log_records = self.COMPACT_MIN_RECORDS * self.COMPACT_RATIO
+                return metadata if isinstance(metadata, dict) else {}
             except (json.JSONDecodeError, OSError) as e:
                 logger.warning(f"Failed to load cache metadata: {e}")
                 return {}
         return {}
 
+    def _append_metadata(self, record: dict) -> None:
+        """Append one mutation record to the log, compacting when it grows too large."""
+        if self._log_records + 1 > max(self.COMPACT_MIN_RECORDS, self.COMPACT_RATIO * len(self._metadata)):
+            self._save_metadata()
+            return
+
+        try:
+            with open(self._metadata_path, "ab") as f:
+                f.write(_dumps_line(record))
+            self._log_records += 1
+        except OSError as e:
+            raise CacheError(f"Failed to save cache metadata: {e}") from e
+
     def _save_metadata(self) -> None:
-        """Save cache metadata atomically (tmp + rename)."""
+        """Rewrite the full metadata log atomically (tmp + rename), one record per live entry."""
         try:
-            tmp_path = self._metadata_path.with_suffix(".json.tmp")
+            tmp_path = self._metadata_path.with_suffix(".jsonl.tmp")
 
-            with open(tmp_path, "w") as f:
-                json.dump(self._metadata, f, indent=2)
+            tmp_path.write_bytes(
+                b"".join(
+                    _dumps_line({"op": "add", "key": key, "entry": entry}) for key, entry in self._metadata.items()
+                )
+            )
 
             # Atomic rename
             tmp_path.replace(self._metadata_path)
+            self._log_records = len(self._metadata)
+
+            # Log now holds everything; drop the legacy document
+            (self._dir / self.LEGACY_METADATA_FILE).unlink(missing_ok=True)
 
         except OSError as e:
             raise CacheError(f"Failed to save cache metadata: {e}") from e
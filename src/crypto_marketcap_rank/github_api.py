@@ -10,12 +10,12 @@ GitHub Issue: https://github.com/terrylica/crypto-marketcap-rank/issues/1
 import contextlib
 import logging
 import os
+import re
+import shutil
 from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
 
-import requests
-
 from .exceptions import DataNotFoundError, DownloadError
 
 # Configure logging
@@ -25,6 +25,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Release tag format: daily-YYYY-MM-DD (compiled once; used for every listed release)
+_DAILY_TAG_RE = re.compile(r"daily-(\d{4}-\d{2}-\d{2})")
+
 
 @dataclass
 class ReleaseInfo:
@@ -48,6 +51,7 @@ class GitHubReleasesClient:
 
     REPO = "terrylica/crypto-marketcap-rank"
     API_BASE = "https://api.github.com"
+    DOWNLOAD_BUFFER_SIZE = 1024 * 1024  # 1 MB copy buffer for asset downloads
 
     def __init__(self, token: str | None = None):
         """Initialize client.
@@ -56,7 +60,10 @@ class GitHubReleasesClient:
             token: GitHub personal access token (optional, from env GITHUB_TOKEN).
                    Required for higher rate limits (60 -> 5000 req/hr).
         """
+        import requests  # Deferred: ~50ms import, only needed once a client is created
+
         self._token = token or os.getenv("GITHUB_TOKEN") or os.getenv("GH_TOKEN")
+        # One keep-alive session per client: API calls and asset downloads share pooled TLS connections
         self._session = requests.Session()
         self._session.headers["Accept"] = "application/vnd.github+json"
         self._session.headers["X-GitHub-Api-Version"] = "2022-11-28"
@@ -77,6 +84,8 @@ class GitHubReleasesClient:
             DataNotFoundError: If no daily releases available.
             DownloadError: If API request fails.
         """
+        import requests
+
         # Query all releases and filter for daily-* tags
         # GitHub's /releases/latest returns the latest semantic version, not daily-*
         url = f"{self.API_BASE}/repos/{self.REPO}/releases"
@@ -126,6 +135,8 @@ class GitHubReleasesClient:
             DataNotFoundError: If no release for that date.
             DownloadError: If API request fails.
         """
+        import requests
+
         tag = f"daily-{target_date.isoformat()}"
         url = f"{self.API_BASE}/repos/{self.REPO}/releases/tags/{tag}"
         logger.debug(f"Fetching release by tag: {tag}")
@@ -152,6 +163,9 @@ class GitHubReleasesClient:
         Raises:
             DownloadError: If download fails.
         """
+        import requests
+        import urllib3
+
         logger.info(f"Downloading {release.asset_name} ({release.size_bytes / 1024 / 1024:.1f} MB)")
 
         try:
@@ -171,15 +185,16 @@ class GitHubReleasesClient:
             # Ensure parent directory exists
             dest_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Stream to file
+            # Stream to file (C-level copy loop with 1 MB buffer; decode gzip/deflate if sent)
+            resp.raw.decode_content = True
             with open(dest_path, "wb") as f:
-                for chunk in resp.iter_content(chunk_size=8192):
-                    f.write(chunk)
+                shutil.copyfileobj(resp.raw, f, length=self.DOWNLOAD_BUFFER_SIZE)
 
             logger.info(f"Downloaded to: {dest_path}")
             return dest_path
 
-        except requests.RequestException as e:
+        # resp.raw surfaces mid-stream failures as urllib3 errors, not requests ones
+        except (requests.RequestException, urllib3.exceptions.HTTPError) as e:
             # Clean up partial download
             if dest_path.exists():
                 dest_path.unlink()
@@ -194,6 +209,8 @@ class GitHubReleasesClient:
         Raises:
             DownloadError: If API request fails.
         """
+        import requests
+
         url = f"{self.API_BASE}/repos/{self.REPO}/releases"
         logger.debug(f"Fetching all releases: {url}")
 
@@ -279,11 +296,11 @@ class GitHubReleasesClient:
         tag = data["tag_name"]
 
         # Parse date from tag (daily-YYYY-MM-DD format)
+        match = _DAILY_TAG_RE.fullmatch(tag)
         try:
-            date_str = tag.replace("daily-", "")
-            release_date = date.fromisoformat(date_str)
+            release_date = date.fromisoformat(match[1]) if match else date.today()
         except ValueError:
-            # Fallback to today if tag format is unexpected
+            # Fallback to today if tag date is out of range (e.g. daily-2025-13-01)
             release_date = date.today()
 
         return ReleaseInfo(
@@ -11,8 +11,6 @@ import tempfile
 from datetime import date
 from pathlib import Path
 
-import duckdb
-
 from .cache import CacheManager
 from .connection import RankingsDatabase
 from .exceptions import DataNotFoundError
@@ -60,7 +58,7 @@ def load_latest(
     logger.info(f"Latest release: {release.tag} ({release.date})")
 
     # Get or download cached database
-    db_path = cache.get_or_download(release, force_refresh=force_refresh)
+    db_path = cache.get_or_download(release, force_refresh=force_refresh, client=client)
 
     return RankingsDatabase(db_path)
 
@@ -102,7 +100,7 @@ def load_date(
     release = client.get_release_by_date(target_date)
 
     # Get or download cached database
-    db_path = cache.get_or_download(release, force_refresh=force_refresh)
+    db_path = cache.get_or_download(release, force_refresh=force_refresh, client=client)
 
     return RankingsDatabase(db_path)
 
@@ -162,7 +160,7 @@ def load_date_range(
     for target_date in dates_to_load:
         try:
             release = client.get_release_by_date(target_date)
-            db_path = cache.get_or_download(release)
+            db_path = cache.get_or_download(release, client=client)
             db_paths.append(db_path)
         except DataNotFoundError:
             skipped_dates.append(target_date)
@@ -224,6 +222,8 @@ def _merge_databases(db_paths: list[Path], cache_dir: Path | None) -> Path:
     if len(db_paths) == 1:
         return db_paths[0]
 
+    import duckdb
+
     # Create merged database in cache or temp
     if cache_dir:
         merged_path = cache_dir / "merged_rankings.duckdb"
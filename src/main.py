@@ -82,7 +82,8 @@ def main(date: str | None = None):
         print("\n2a. Building DuckDB...")
         duckdb_builder = DuckDBBuilder()
         duckdb_file = duckdb_builder.build(raw_file)
-        duckdb_builder.validate(duckdb_file)
+        # build() already ran full validation on these rows; re-check the written schema only
+        duckdb_builder.validate(duckdb_file, level="schema")
         built_files['duckdb'] = duckdb_file
         print(f"✅ DuckDB complete: {duckdb_file}")
 
@@ -16,6 +16,7 @@ Adheres to SLO:
 - Availability: Apache Arrow ecosystem (10-year future-proof)
 """
 
+import functools
 import json
 from typing import Any, Dict
 
@@ -169,10 +170,13 @@ def export_json_schema() -> Dict[str, Any]:
     }
 
 
+@functools.cache
 def get_duckdb_ddl() -> str:
     """
     Generate DuckDB CREATE TABLE DDL from PyArrow schema.
 
+    The schema is a module constant, so the DDL is built once and cached.
+
     Returns:
         SQL DDL string
     """
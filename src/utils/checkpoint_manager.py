@@ -14,16 +14,53 @@ Adheres to SLO:
 - Observability: Log checkpoint save/restore operations
 """
 
+import bisect
+import ctypes
 import json
+import os
+import sys
+from contextlib import contextmanager
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
+try:
+    import orjson
+except ImportError:  # Optional: fall back to stdlib json
+    orjson = None
 
-@dataclass
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to indented JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes (orjson.JSONDecodeError subclasses json.JSONDecodeError)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _load_syncfs():
+    """Return libc syncfs(fd) on Linux (one flush for a whole filesystem), else None."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        return ctypes.CDLL(None, use_errno=True).syncfs
+    except (OSError, AttributeError):
+        return None
+
+
+_syncfs = _load_syncfs()
+
+
+@dataclass(slots=True, frozen=True)
 class Checkpoint:
-    """Collection checkpoint state."""
+    """Collection checkpoint state (immutable snapshot; save a new one to advance)."""
     date: str
     last_page: int
     total_coins_collected: int
@@ -43,6 +80,8 @@ class CheckpointManager:
 
     Features:
     - Atomic checkpoint writes (tmp + rename)
+    - Batched durability via bulk_save() (one flush for many saves)
+    - In-memory sorted index for list_checkpoints() (no directory rescan)
     - JSON serialization for GitHub Actions cache
     - Validation on restore (schema + data integrity)
     - Raise on corruption (no silent failures)
@@ -82,6 +121,16 @@ class CheckpointManager:
         self.checkpoint_dir = Path(checkpoint_dir)
         self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
 
+        # bulk_save() state: nesting depth and files awaiting the single flush
+        self._bulk_depth = 0
+        self._pending_sync: List[Path] = []
+
+        # Sorted checkpoint dates, scanned once and kept in sync by save()/delete()
+        self._index: List[str] = sorted(
+            filepath.stem.removeprefix("checkpoint_")
+            for filepath in self.checkpoint_dir.glob("checkpoint_*.json")
+        )
+
     def save(self, checkpoint: Checkpoint) -> Path:
         """
         Save checkpoint atomically.
@@ -101,12 +150,18 @@ class CheckpointManager:
             tmp_filepath = self.checkpoint_dir / f"{filename}.tmp"
 
             # Write to temp file first
-            with open(tmp_filepath, 'w') as f:
-                json.dump(asdict(checkpoint), f, indent=2)
+            tmp_filepath.write_bytes(_dumps(asdict(checkpoint)))
 
             # Atomic rename
             tmp_filepath.replace(filepath)
 
+            position = bisect.bisect_left(self._index, checkpoint.date)
+            if position == len(self._index) or self._index[position] != checkpoint.date:
+                self._index.insert(position, checkpoint.date)
+
+            if self._bulk_depth:
+                self._pending_sync.append(filepath)
+
             print(f"✓ Checkpoint saved: {filepath}")
             print(f"  Page: {checkpoint.last_page}, Coins: {checkpoint.total_coins_collected}, "
                   f"API calls: {checkpoint.api_calls_used}")
@@ -116,6 +171,86 @@ class CheckpointManager:
         except Exception as e:
             raise CheckpointError(f"Failed to save checkpoint: {e}") from e
 
+    def save_batch(self, checkpoints: Iterable[Checkpoint]) -> List[Path]:
+        """
+        Save several checkpoints, then flush them to disk once.
+
+        Args:
+            checkpoints: Checkpoint states to save
+
+        Returns:
+            Paths to saved checkpoint files
+
+        Raises:
+            CheckpointError: If any save or the final flush fails
+        """
+        with self.bulk_save():
+            return [self.save(checkpoint) for checkpoint in checkpoints]
+
+    @contextmanager
+    def bulk_save(self) -> Iterator["CheckpointManager"]:
+        """
+        Group save() calls and make them durable with a single flush on exit.
+
+        Uses one syncfs() on Linux; elsewhere fsyncs each saved file and the
+        checkpoint directory once at the end instead of per save.
+
+        Usage:
+            with manager.bulk_save():
+                for checkpoint in checkpoints:
+                    manager.save(checkpoint)
+
+        Raises:
+            CheckpointError: If the final flush fails (only when the block itself
+                completed; otherwise the block's exception propagates unchanged)
+        """
+        self._bulk_depth += 1
+        try:
+            yield self
+        except BaseException:
+            # Still flush the saves that completed, but never mask the block's exception
+            try:
+                self._end_bulk()
+            except CheckpointError as e:
+                print(f"⚠️  {e}")
+            raise
+        self._end_bulk()
+
+    def _end_bulk(self) -> None:
+        """Leave one bulk_save() level, flushing pending files at the outermost one."""
+        self._bulk_depth -= 1
+        if self._bulk_depth == 0:
+            pending, self._pending_sync = self._pending_sync, []
+            if pending:
+                self._flush(pending)
+
+    def _flush(self, paths: List[Path]) -> None:
+        """Flush saved checkpoint files and their directory entries to disk."""
+        if os.name == "nt":
+            # Directories cannot be opened for fsync on Windows
+            return
+
+        try:
+            dir_fd = os.open(self.checkpoint_dir, os.O_RDONLY)
+            try:
+                if _syncfs is not None:
+                    if _syncfs(dir_fd) != 0:
+                        errno = ctypes.get_errno()
+                        raise OSError(errno, os.strerror(errno))
+                    return
+
+                for path in paths:
+                    fd = os.open(path, os.O_RDONLY)
+                    try:
+                        os.fsync(fd)
+                    finally:
+                        os.close(fd)
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        except OSError as e:
+            raise CheckpointError(f"Failed to flush checkpoints: {e}") from e
+
     def restore(self, date: str) -> Optional[Checkpoint]:
         """
         Restore checkpoint for given date.
@@ -137,8 +272,7 @@ class CheckpointManager:
             return None
 
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            data = _loads(filepath.read_bytes())
 
             # Validate required fields
             required_fields = ["date", "last_page", "total_coins_collected",
@@ -190,6 +324,8 @@ class CheckpointManager:
 
         if filepath.exists():
             filepath.unlink()
+            if date in self._index:
+                self._index.remove(date)
             print(f"✓ Checkpoint deleted: {filepath}")
             return True
 
@@ -199,16 +335,13 @@ class CheckpointManager:
         """
         List all available checkpoints.
 
+        Served from the in-memory index (directory is scanned once in
+        __init__); files written by other processes after that are not seen.
+
         Returns:
-            List of dates with checkpoints (YYYY-MM-DD)
+            Sorted list of dates with checkpoints (YYYY-MM-DD)
         """
-        checkpoints = []
-        for filepath in self.checkpoint_dir.glob("checkpoint_*.json"):
-            # Extract date from filename: checkpoint_YYYY-MM-DD.json
-            date = filepath.stem.replace("checkpoint_", "")
-            checkpoints.append(date)
-
-        return sorted(checkpoints)
+        return self._index.copy()
 
 
 if __name__ == "__main__":
@@ -15,9 +15,10 @@ Adheres to SLO:
 """
 
 import time
+from array import array
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, Optional
 
 
 @dataclass
@@ -28,10 +29,55 @@ class RateLimitConfig:
     warn_threshold: float = 0.8  # Warn at 80% usage
 
 
+class CallWindow:
+    """
+    Fixed-capacity ring buffer of call timestamps (oldest first).
+
+    Stores raw doubles in a preallocated array('d') instead of boxed floats.
+    Capacity is calls_per_minute: acquire() never records more calls than that
+    inside the window, so appending to a full window overwrites the oldest.
+    """
+
+    def __init__(self, capacity: int):
+        self._buffer = array("d", bytes(8 * capacity))
+        self._capacity = capacity
+        self._head = 0  # Index of oldest timestamp
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def oldest(self) -> float:
+        """Timestamp of the oldest tracked call (window must be non-empty)."""
+        return self._buffer[self._head]
+
+    def append(self, timestamp: float) -> None:
+        """Record a call timestamp (newest)."""
+        if self._count == self._capacity:
+            self._head = (self._head + 1) % self._capacity
+            self._count -= 1
+        self._buffer[(self._head + self._count) % self._capacity] = timestamp
+        self._count += 1
+
+    def drop_until(self, cutoff: float) -> None:
+        """Drop timestamps <= cutoff (expired calls are always at the front)."""
+        buffer, capacity = self._buffer, self._capacity
+        while self._count and buffer[self._head] <= cutoff:
+            self._head = (self._head + 1) % capacity
+            self._count -= 1
+
+    def reset(self, timestamps: Iterable[float] = ()) -> None:
+        """Replace the window contents with timestamps (oldest first)."""
+        self._head = self._count = 0
+        for timestamp in timestamps:
+            self.append(timestamp)
+
+
 @dataclass
 class RateLimitMetrics:
     """Rate limit usage metrics."""
-    minute_calls: list = field(default_factory=list)  # (timestamp, count) tuples
+    # time.monotonic() per call, oldest first
+    minute_calls: CallWindow = field(default_factory=lambda: CallWindow(RateLimitConfig.calls_per_minute))
     monthly_calls: int = 0
     month_start: Optional[datetime] = None
 
@@ -57,7 +103,7 @@ class RateLimiter:
     Production rate limiter for CoinGecko API.
 
     Features:
-    - Per-minute sliding window (30 calls/min)
+    - Per-minute sliding window (30 calls/min, monotonic clock, array ring buffer)
     - Per-month quota tracking (10,000 calls/month)
     - Warning thresholds (80% usage alerts)
     - Raise on quota exceeded (no silent failures)
@@ -76,7 +122,7 @@ class RateLimiter:
             config: Rate limit configuration (defaults to CoinGecko free tier)
         """
         self.config = config or RateLimitConfig()
-        self.metrics = RateLimitMetrics()
+        self.metrics = RateLimitMetrics(minute_calls=CallWindow(self.config.calls_per_minute))
 
     def acquire(self, wait: bool = True) -> None:
         """
@@ -97,7 +143,7 @@ class RateLimiter:
             )
 
         # Check minute limit (can wait)
-        now = time.time()
+        now = time.monotonic()
         self._cleanup_old_calls(now)
 
         current_minute_calls = len(self.metrics.minute_calls)
@@ -109,14 +155,14 @@ class RateLimiter:
                 )
 
             # Calculate wait time until oldest call expires
-            oldest_call = self.metrics.minute_calls[0]
+            oldest_call = self.metrics.minute_calls.oldest()
             wait_time = 60 - (now - oldest_call)
 
             if wait_time > 0:
                 time.sleep(wait_time + 0.1)  # Add 100ms buffer
 
             # Cleanup after waiting
-            now = time.time()
+            now = time.monotonic()
             self._cleanup_old_calls(now)
 
         # Record this call
@@ -132,8 +178,7 @@ class RateLimiter:
 
     def _cleanup_old_calls(self, now: float) -> None:
         """Remove calls older than 60 seconds from tracking."""
-        cutoff = now - 60
-        self.metrics.minute_calls = [ts for ts in self.metrics.minute_calls if ts > cutoff]
+        self.metrics.minute_calls.drop_until(now - 60)
 
     def get_metrics(self) -> dict:
         """
@@ -143,7 +188,7 @@ class RateLimiter:
             Dictionary with usage statistics
         """
         self.metrics.reset_if_new_month()
-        now = time.time()
+        now = time.monotonic()
         self._cleanup_old_calls(now)
 
         monthly_pct = (self.metrics.monthly_calls / self.config.calls_per_month) * 100
@@ -11,7 +11,9 @@ from .schema_validator import (
     RangeError,
     SchemaError,
     ValidationError,
+    ValidationLevel,
     validate_arrow_table,
+    validate_arrow_table_ok,
 )
 from .schema_validator import (
     ValueError as ValidationValueError,
@@ -19,10 +21,12 @@ from .schema_validator import (
 
 __all__ = [
     "ValidationError",
+    "ValidationLevel",
     "SchemaError",
     "DuplicateError",
     "NullError",
     "RangeError",
     "ValidationValueError",
     "validate_arrow_table",
+    "validate_arrow_table_ok",
 ]
@@ -11,12 +11,33 @@ Adheres to SLO:
 - Availability: Fail-fast on errors (raise + propagate)
 """
 
-from typing import List
+import builtins
+from typing import List, Literal, Sequence, Tuple
 
 import pyarrow as pa
+import pyarrow.compute as pc
 
 from schemas.crypto_rankings_schema import CRYPTO_RANKINGS_SCHEMA_V2
 
+# Schema lookups computed once at import time (schema is a module-level constant)
+_EXPECTED_NAMES = [field.name for field in CRYPTO_RANKINGS_SCHEMA_V2]
+_EXPECTED_NAMES_SET = frozenset(_EXPECTED_NAMES)
+_EXPECTED_TYPES = {field.name: field.type for field in CRYPTO_RANKINGS_SCHEMA_V2}
+
+# Required (non-nullable) columns, checked for NULLs by rule 3
+_REQUIRED_FIELDS = tuple(field.name for field in CRYPTO_RANKINGS_SCHEMA_V2 if not field.nullable)
+
+# Hive partition columns (added by PyArrow when reading partitioned Parquet)
+_ALLOWED_PARTITION_COLUMNS = frozenset({"year", "month", "day"})
+
+# Shared result for checks that pass (avoids allocating an empty list per check)
+_NO_ERRORS: Sequence["ValidationError"] = ()
+
+# "schema": rule 1 only (for tables our own code already validated in full)
+# "full": all rules (ingest boundaries, e.g. raw API data)
+ValidationLevel = Literal["schema", "full"]
+_VALIDATION_LEVELS = frozenset({"schema", "full"})
+
 
 # Validation Error Classes
 class ValidationError(Exception):
@@ -55,98 +76,94 @@ class ValueError(ValidationError):
     pass
 
 
-def validate_arrow_table(table: pa.Table) -> List[ValidationError]:
-    """
-    Comprehensive validation for PyArrow Table.
-
-    Validation Rules:
-    1. Schema conformance (exact match with CRYPTO_RANKINGS_SCHEMA_V2)
-    2. No duplicate (date, coin_id) pairs
-    3. No NULL values in required fields (date, rank, coin_id)
-    4. Rank range validation (all >= 1, max reasonable)
-    5. Market cap >= 0 for non-NULL values
-
-    Args:
-        table: PyArrow Table to validate
+def _check_schema(table: pa.Table) -> Sequence[ValidationError]:
+    """Validation 1: Schema conformance (detailed diff against CRYPTO_RANKINGS_SCHEMA_V2)."""
+    try:
+        if table.schema.equals(CRYPTO_RANKINGS_SCHEMA_V2):
+            return _NO_ERRORS
+
+        # Detailed comparison: one pass over expected fields collects
+        # missing columns and type mismatches together
+        actual_types = dict(zip(table.schema.names, table.schema.types))
+
+        missing = set()
+        mismatches: List[ValidationError] = []
+        for name, expected_type in _EXPECTED_TYPES.items():
+            actual_type = actual_types.get(name)
+            if actual_type is None:
+                missing.add(name)
+            elif actual_type != expected_type:
+                mismatches.append(
+                    SchemaError(f"Column '{name}' type mismatch: expected {expected_type}, got {actual_type}")
+                )
+        extra = actual_types.keys() - _EXPECTED_NAMES_SET - _ALLOWED_PARTITION_COLUMNS
+
+        errors: List[ValidationError] = []
+        if missing:
+            errors.append(SchemaError(f"Missing columns: {missing}"))
+        if extra:
+            errors.append(SchemaError(f"Extra columns: {extra}"))
+        errors.extend(mismatches)
+        return errors
+    except Exception as e:
+        return [SchemaError(f"Schema validation failed: {e}")]
 
-    Returns:
-        List of ValidationError instances (empty if valid)
 
-    Raises:
-        Never raises - returns errors in list for caller to handle
-    """
-    errors: List[ValidationError] = []
-
-    # Validation 1: Schema Conformance
+def _check_duplicates(table: pa.Table) -> Sequence[ValidationError]:
+    """Validation 2: No duplicate (date, coin_id) pairs."""
     try:
-        if not table.schema.equals(CRYPTO_RANKINGS_SCHEMA_V2):
-            # Detailed comparison
-            expected_names = [field.name for field in CRYPTO_RANKINGS_SCHEMA_V2]
-            actual_names = table.schema.names
-
-            missing = set(expected_names) - set(actual_names)
-            extra = set(actual_names) - set(expected_names)
-
-            # Allow Hive partition columns (added by PyArrow when reading partitioned Parquet)
-            allowed_partition_columns = {"year", "month", "day"}
-            extra = extra - allowed_partition_columns
-
-            if missing:
-                errors.append(SchemaError(f"Missing columns: {missing}"))
-            if extra:
-                errors.append(SchemaError(f"Extra columns: {extra}"))
-
-            # Type mismatches
-            for field in CRYPTO_RANKINGS_SCHEMA_V2:
-                if field.name in actual_names:
-                    actual_type = table.schema.field(field.name).type
-                    if actual_type != field.type:
-                        errors.append(
-                            SchemaError(
-                                f"Column '{field.name}' type mismatch: expected {field.type}, got {actual_type}"
-                            )
-                        )
+        # Hash-aggregate in Arrow (no pandas materialization)
+        counts = table.select(["date", "coin_id"]).group_by(["date", "coin_id"]).aggregate([([], "count_all")])
+
+        # One group per row means every key is unique: skip the compare + filter kernels
+        if counts.num_rows == table.num_rows:
+            return _NO_ERRORS
+
+        duplicates = counts.filter(pc.greater(counts["count_all"], 1))
+        if duplicates.num_rows > 0:
+            dup_count = pc.sum(duplicates["count_all"]).as_py()
+            sample = duplicates.slice(0, 5).to_pylist()
+            return [DuplicateError(f"Found {dup_count} duplicate (date, coin_id) pairs. Sample: {sample}")]
     except Exception as e:
-        errors.append(SchemaError(f"Schema validation failed: {e}"))
+        return [DuplicateError(f"Duplicate check failed: {e}")]
+    return _NO_ERRORS
+
 
-    # Validation 2: Duplicate Detection
+def _check_nulls(table: pa.Table) -> Sequence[ValidationError]:
+    """Validation 3: No NULL values in required fields."""
     try:
-        df = table.to_pandas()
-        duplicates = df[df.duplicated(subset=["date", "coin_id"], keep=False)]
-        if not duplicates.empty:
-            dup_count = len(duplicates)
-            sample = duplicates[["date", "coin_id", "rank"]].head(5).to_dict("records")
-            errors.append(DuplicateError(f"Found {dup_count} duplicate (date, coin_id) pairs. Sample: {sample}"))
-    except Exception as e:
-        errors.append(DuplicateError(f"Duplicate check failed: {e}"))
+        required = table.select(list(_REQUIRED_FIELDS))
+        null_counts = {field: required[field].null_count for field in _REQUIRED_FIELDS}
 
-    # Validation 3: Required Field NULL Checks
-    required_fields = ["date", "rank", "coin_id"]
-    for field in required_fields:
-        try:
-            null_count = table[field].null_count
+        errors: List[ValidationError] = []
+        for field, null_count in null_counts.items():
             if null_count > 0:
                 # Find sample NULL rows
-                df = table.to_pandas()
-                null_rows = df[df[field].isnull()].head(5)
-                sample = null_rows[["date", "rank", "coin_id"]].to_dict("records")
+                null_indices = pc.indices_nonzero(pc.is_null(required[field])).slice(0, 5)
+                sample = required.take(null_indices).to_pylist()
                 errors.append(
                     NullError(f"Found {null_count} NULL values in required field '{field}'. Sample: {sample}")
                 )
-        except Exception as e:
-            errors.append(NullError(f"NULL check failed for '{field}': {e}"))
-
-    # Validation 4: Rank Range Validation
-    # Note: CoinGecko API has natural characteristics:
-    #   - Rank gaps: coins without market cap data skip rank numbers
-    #   - Rank ties: coins with equal market cap share the same rank
-    # We only validate: all ranks >= 1, max rank is reasonable
+        return errors or _NO_ERRORS
+    except Exception as e:
+        return [NullError(f"NULL check failed for required fields {list(_REQUIRED_FIELDS)}: {e}")]
+
+
+def _check_rank_range(table: pa.Table) -> Sequence[ValidationError]:
+    """
+    Validation 4: Rank range.
+
+    Note: CoinGecko API has natural characteristics:
+      - Rank gaps: coins without market cap data skip rank numbers
+      - Rank ties: coins with equal market cap share the same rank
+    We only validate: all ranks >= 1, max rank is reasonable
+    """
+    errors: List[ValidationError] = []
     try:
-        ranks = table["rank"].to_pylist()
-        if ranks:
-            min_rank = min(ranks)
-            max_rank = max(ranks)
-            row_count = len(ranks)
+        rank_bounds = pc.min_max(table["rank"]).as_py()
+        min_rank, max_rank = rank_bounds["min"], rank_bounds["max"]
+        if min_rank is not None:
+            row_count = table.num_rows
 
             if min_rank < 1:
                 errors.append(RangeError(f"Rank minimum is {min_rank}, expected >= 1"))
@@ -157,23 +174,108 @@ def validate_arrow_table(table: pa.Table) -> List[ValidationError]:
                 errors.append(RangeError(f"Rank maximum {max_rank} too high for {row_count} rows"))
     except Exception as e:
         errors.append(RangeError(f"Rank validation failed: {e}"))
+    return errors or _NO_ERRORS
+
 
-    # Validation 5: Market Cap Value Validation
+def _check_market_cap(table: pa.Table) -> Sequence[ValidationError]:
+    """Validation 5: market_cap >= 0 for non-NULL values."""
     try:
-        market_caps = [c for c in table["market_cap"].to_pylist() if c is not None]
-        if market_caps:
-            negative_caps = [c for c in market_caps if c < 0]
-            if negative_caps:
-                errors.append(
-                    ValueError(f"Found {len(negative_caps)} negative market_cap values. Sample: {negative_caps[:5]}")
-                )
+        market_caps = table["market_cap"]
+        min_cap = pc.min(market_caps).as_py()
+        if min_cap is not None and min_cap < 0:
+            # Only build the sample when a negative value exists
+            negative_mask = pc.less(market_caps, 0)
+            negative_count = pc.sum(pc.cast(negative_mask, pa.int64())).as_py()
+            sample = market_caps.take(pc.indices_nonzero(negative_mask).slice(0, 5)).to_pylist()
+            return [ValueError(f"Found {negative_count} negative market_cap values. Sample: {sample}")]
     except Exception as e:
-        errors.append(ValueError(f"Market cap validation failed: {e}"))
+        return [ValueError(f"Market cap validation failed: {e}")]
+    return _NO_ERRORS
+
+
+# Row-level rules 2-5, in reporting order
+_ROW_CHECKS = (_check_duplicates, _check_nulls, _check_rank_range, _check_market_cap)
+
+
+def _collect_errors(
+    table: pa.Table, level: ValidationLevel = "full", fail_fast: bool = False
+) -> Sequence[ValidationError]:
+    """Run validation rules for level; returns the shared _NO_ERRORS tuple when the table is valid."""
+    if level not in _VALIDATION_LEVELS:
+        # builtins: this module's ValueError is a ValidationError subclass
+        raise builtins.ValueError(f"Unknown validation level {level!r}, expected one of {sorted(_VALIDATION_LEVELS)}")
+
+    schema_errors = _check_schema(table)
+
+    # Fast path: schema-only level, or conforming empty table (no rows for rules 2-5)
+    if level == "schema" or (not schema_errors and table.num_rows == 0):
+        return schema_errors or _NO_ERRORS
+
+    if fail_fast:
+        # Stop at the first failing rule; later rules never scan the table
+        if schema_errors:
+            return schema_errors
+        for check in _ROW_CHECKS:
+            errors = check(table)
+            if errors:
+                return errors
+        return _NO_ERRORS
+
+    # Passing checks return the shared empty tuple; the result list is built once
+    errors = [*schema_errors, *(error for check in _ROW_CHECKS for error in check(table))]
+    return errors or _NO_ERRORS
+
 
-    return errors
+def validate_arrow_table(
+    table: pa.Table, level: ValidationLevel = "full", *, fail_fast: bool = False
+) -> List[ValidationError]:
+    """
+    Comprehensive validation for PyArrow Table.
+
+    Validation Rules:
+    1. Schema conformance (exact match with CRYPTO_RANKINGS_SCHEMA_V2)
+    2. No duplicate (date, coin_id) pairs
+    3. No NULL values in required fields (date, rank, coin_id)
+    4. Rank range validation (all >= 1, max reasonable)
+    5. Market cap >= 0 for non-NULL values
+
+    An exact schema match skips the per-field diff; rules 2-5 run as
+    Arrow compute kernels.
+
+    Args:
+        table: PyArrow Table to validate
+        level: "full" runs all rules; "schema" runs rule 1 only, for tables
+               produced by code that already ran full validation
+        fail_fast: If True, stop after the first rule that fails and return
+                   only its errors (callers that only need pass/fail)
+
+    Returns:
+        List of ValidationError instances (empty if valid)
+
+    Raises:
+        builtins.ValueError: If level is unknown (data errors are never raised)
+    """
+    return list(_collect_errors(table, level, fail_fast))
 
 
-def validate_and_raise(table: pa.Table) -> None:
+def validate_arrow_table_ok(table: pa.Table, level: ValidationLevel = "full") -> bool:
+    """
+    Check whether a PyArrow Table passes validation.
+
+    Runs with fail_fast, so an invalid table is rejected at its first
+    failing rule without building the remaining error reports.
+
+    Args:
+        table: PyArrow Table to validate
+        level: Validation level, see validate_arrow_table()
+
+    Returns:
+        True if the table is valid
+    """
+    return _collect_errors(table, level, fail_fast=True) is _NO_ERRORS
+
+
+def validate_and_raise(table: pa.Table, level: ValidationLevel = "full") -> None:
     """
     Validate PyArrow Table and raise exception if errors found.
 
@@ -182,40 +284,59 @@ def validate_and_raise(table: pa.Table) -> None:
 
     Args:
         table: PyArrow Table to validate
+        level: Validation level, see validate_arrow_table()
 
     Raises:
         ValidationError: If any validation errors found
     """
-    errors = validate_arrow_table(table)
-    if errors:
-        error_messages = "\n".join([f"  - {e}" for e in errors])
-        raise ValidationError(f"Validation failed with {len(errors)} error(s):\n{error_messages}")
+    errors = _collect_errors(table, level)
+    if errors is _NO_ERRORS:
+        return
 
+    error_messages = "\n".join(f"  - {e}" for e in errors)
+    raise ValidationError(f"Validation failed with {len(errors)} error(s):\n{error_messages}")
 
-if __name__ == "__main__":
+
+def _build_demo_tables() -> Tuple[pa.Table, pa.Table]:
+    """Build the valid and duplicate-coin demo tables used by __main__."""
     from datetime import date
 
-    import pyarrow as pa
+    valid_table = pa.table(
+        {
+            "date": [date(2025, 11, 23)] * 3,
+            "rank": [1, 2, 3],
+            "coin_id": ["bitcoin", "ethereum", "tether"],
+            "symbol": ["BTC", "ETH", "USDT"],
+            "name": ["Bitcoin", "Ethereum", "Tether"],
+            "market_cap": [1000000.0, 500000.0, 300000.0],
+            "price": [50000.0, 3000.0, 1.0],
+            "volume_24h": [100000.0, 50000.0, 30000.0],
+            "price_change_24h_pct": [2.5, -1.3, 0.01],
+        },
+        schema=CRYPTO_RANKINGS_SCHEMA_V2,
+    )
+
+    # Same rows with a duplicate coin; other columns are shared zero-copy
+    duplicate_columns = {
+        "coin_id": ["bitcoin", "bitcoin", "tether"],
+        "symbol": ["BTC", "BTC", "USDT"],
+        "name": ["Bitcoin", "Bitcoin", "Tether"],
+    }
+    invalid_table = valid_table
+    for name, values in duplicate_columns.items():
+        index = invalid_table.schema.get_field_index(name)
+        invalid_table = invalid_table.set_column(index, invalid_table.schema.field(name), pa.array(values))
+
+    return valid_table, invalid_table
+
+
+if __name__ == "__main__":
+    table, invalid_table = _build_demo_tables()
 
     # Test validation with valid data
     print("Testing schema validator...")
     print("=" * 80)
 
-    # Create valid test table
-    test_data = {
-        "date": [date(2025, 11, 23)] * 3,
-        "rank": [1, 2, 3],
-        "coin_id": ["bitcoin", "ethereum", "tether"],
-        "symbol": ["BTC", "ETH", "USDT"],
-        "name": ["Bitcoin", "Ethereum", "Tether"],
-        "market_cap": [1000000.0, 500000.0, 300000.0],
-        "price": [50000.0, 3000.0, 1.0],
-        "volume_24h": [100000.0, 50000.0, 30000.0],
-        "price_change_24h_pct": [2.5, -1.3, 0.01],
-    }
-
-    table = pa.table(test_data, schema=CRYPTO_RANKINGS_SCHEMA_V2)
-
     errors = validate_arrow_table(table)
     if not errors:
         print("✅ Valid table passed all checks")
@@ -228,19 +349,6 @@ if __name__ == "__main__":
 
     # Test with invalid data (duplicates)
     print("Testing with duplicate data...")
-    invalid_data = {
-        "date": [date(2025, 11, 23)] * 3,
-        "rank": [1, 2, 3],
-        "coin_id": ["bitcoin", "bitcoin", "tether"],  # Duplicate
-        "symbol": ["BTC", "BTC", "USDT"],
-        "name": ["Bitcoin", "Bitcoin", "Tether"],
-        "market_cap": [1000000.0, 500000.0, 300000.0],
-        "price": [50000.0, 3000.0, 1.0],
-        "volume_24h": [100000.0, 50000.0, 30000.0],
-        "price_change_24h_pct": [2.5, -1.3, 0.01],
-    }
-
-    invalid_table = pa.table(invalid_data, schema=CRYPTO_RANKINGS_SCHEMA_V2)
     errors = validate_arrow_table(invalid_table)
     if errors:
         print(f"✅ Correctly detected {len(errors)} error(s):")
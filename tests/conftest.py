@@ -8,19 +8,21 @@ import sys
 import tempfile
 from datetime import date
 from pathlib import Path
-from unittest.mock import MagicMock
+from types import MappingProxyType
 
-import duckdb
+import pyarrow as pa
 import pytest
 
-# Add src to path
+# Add src to path once for every test module (they import schemas, validators, utils, ...)
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from schemas.crypto_rankings_schema import CRYPTO_RANKINGS_SCHEMA_V2
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def sample_coins():
-    """Sample coin data matching CoinGecko API response format."""
-    return [
+    """Sample coin data matching CoinGecko API response format (read-only, shared per session)."""
+    coins = [
         {
             "id": "bitcoin",
             "symbol": "btc",
@@ -52,6 +54,7 @@ def sample_coins():
             "price_change_percentage_24h": 0.01,
         },
     ]
+    return tuple(MappingProxyType(coin) for coin in coins)
 
 
 @pytest.fixture
@@ -67,52 +70,52 @@ def temp_db_path(temp_cache_dir):
     return temp_cache_dir / "test_rankings.duckdb"
 
 
-@pytest.fixture
-def sample_db(temp_db_path, sample_coins):
-    """Create a sample DuckDB database with test data."""
-    con = duckdb.connect(str(temp_db_path))
+@pytest.fixture(scope="session")
+def sample_rankings_table(sample_coins):
+    """Sample coins as a Schema V2 Arrow table."""
+    test_date = date(2025, 1, 15)
+    return pa.Table.from_pylist(
+        [
+            {
+                "date": test_date,
+                "rank": coin["market_cap_rank"],
+                "coin_id": coin["id"],
+                "symbol": coin["symbol"],
+                "name": coin["name"],
+                "market_cap": coin["market_cap"],
+                "price": coin["current_price"],
+                "volume_24h": coin["total_volume"],
+                "price_change_24h_pct": coin["price_change_percentage_24h"],
+            }
+            for coin in sample_coins
+        ],
+        schema=CRYPTO_RANKINGS_SCHEMA_V2,
+    )
 
-    # Create rankings table matching Schema V2
-    con.execute("""
-        CREATE TABLE rankings (
-            date DATE,
-            rank BIGINT,
-            coin_id VARCHAR,
-            symbol VARCHAR,
-            name VARCHAR,
-            market_cap DOUBLE,
-            price DOUBLE,
-            volume_24h DOUBLE,
-            price_change_24h_pct DOUBLE
-        )
-    """)
 
-    # Insert sample data
-    test_date = date(2025, 1, 15)
-    for coin in sample_coins:
-        con.execute(
-            """
-            INSERT INTO rankings VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            [
-                test_date,
-                coin["market_cap_rank"],
-                coin["id"],
-                coin["symbol"],
-                coin["name"],
-                coin["market_cap"],
-                coin["current_price"],
-                coin["total_volume"],
-                coin["price_change_percentage_24h"],
-            ],
-        )
+@pytest.fixture(scope="session")
+def sample_db(tmp_path_factory, sample_rankings_table):
+    """Sample DuckDB database built once per session (per xdist worker).
+
+    Shared by all tests, so it must never be modified: consumers open it
+    through RankingsDatabase, which connects read-only.
+    """
+    import duckdb
+
+    template_path = tmp_path_factory.mktemp("sample_db") / "rankings.duckdb"
+    con = duckdb.connect(str(template_path))
+
+    # Bulk-insert sample data as one Arrow table
+    con.from_arrow(sample_rankings_table).create("rankings")
 
     # Create indexes
-    con.execute("CREATE INDEX idx_date ON rankings(date)")
-    con.execute("CREATE INDEX idx_rank ON rankings(rank)")
+    con.execute("""
+        CREATE INDEX idx_date ON rankings(date);
+        CREATE INDEX idx_rank ON rankings(rank);
+    """)
     con.close()
 
-    return temp_db_path
+    return template_path
 
 
 @pytest.fixture
@@ -132,7 +135,38 @@ def mock_release_info():
 @pytest.fixture
 def mock_github_client(mock_release_info):
     """Mock GitHubReleasesClient for testing without network."""
+    from unittest.mock import MagicMock
+
     client = MagicMock()
     client.get_latest_release.return_value = mock_release_info
     client.get_release_by_date.return_value = mock_release_info
     return client
+
+
+@pytest.fixture
+def mock_loader(monkeypatch, sample_db, mock_release_info):
+    """Replace the loader's network layer with spec'd mocks serving sample_db.
+
+    Uses monkeypatch.setattr on the loader module (no patch() target
+    resolution); mocks are fresh per test so call assertions never leak.
+
+    Returns:
+        (mock_cache, mock_client) instances returned by the replaced
+        CacheManager and GitHubReleasesClient constructors.
+    """
+    from unittest.mock import MagicMock
+
+    from crypto_marketcap_rank import loader
+    from crypto_marketcap_rank.cache import CacheManager
+    from crypto_marketcap_rank.github_api import GitHubReleasesClient
+
+    mock_cache = MagicMock(spec=CacheManager)
+    mock_cache.get_or_download.return_value = sample_db
+
+    mock_client = MagicMock(spec=GitHubReleasesClient)
+    mock_client.get_latest_release.return_value = mock_release_info
+    mock_client.get_release_by_date.return_value = mock_release_info
+
+    monkeypatch.setattr(loader, "CacheManager", lambda *args, **kwargs: mock_cache)
+    monkeypatch.setattr(loader, "GitHubReleasesClient", lambda *args, **kwargs: mock_client)
+    return mock_cache, mock_client
@@ -5,15 +5,12 @@ GitHub Issue: https://github.com/terrylica/crypto-marketcap-rank/issues/4
 """
 
 import json
-import sys
 import tempfile
 from pathlib import Path
 
 import duckdb
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
-
 from builders.base_builder import BuildError
 from builders.build_duckdb import DuckDBBuilder
 
@@ -25,7 +22,7 @@ def raw_json_file(sample_coins):
         mode="w", suffix=".json", delete=False
     ) as f:
         data = {
-            "coins": sample_coins,
+            "coins": [dict(coin) for coin in sample_coins],
             "metadata": {
                 "collection_date": "2025-01-15",
                 "api_calls_used": 1,
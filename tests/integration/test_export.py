@@ -4,14 +4,9 @@ Integration tests for Parquet Export.
 GitHub Issue: https://github.com/terrylica/crypto-marketcap-rank/issues/4
 """
 
-import sys
-from pathlib import Path
-
 import pyarrow.parquet as pq
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
-
 from crypto_marketcap_rank.connection import RankingsDatabase
 
 
@@ -36,8 +31,8 @@ class TestRankingsDatabaseExportParquet:
 
         db.export_parquet(output_path)
 
-        # Read back with PyArrow
-        table = pq.read_table(output_path)
+        # Read back with PyArrow (only the columns asserted on)
+        table = pq.read_table(output_path, columns=["rank", "symbol"], use_threads=True)
         assert len(table) == 3  # sample_coins has 3 coins
         assert "rank" in table.column_names
         assert "symbol" in table.column_names
@@ -50,7 +45,8 @@ class TestRankingsDatabaseExportParquet:
 
         db.export_parquet(output_path)
 
-        table = pq.read_table(output_path)
+        # Footer metadata only; no column data is decoded
+        schema = pq.ParquetFile(output_path).schema_arrow
         expected_columns = {
             "date",
             "rank",
@@ -62,7 +58,7 @@ class TestRankingsDatabaseExportParquet:
             "volume_24h",
             "price_change_24h_pct",
         }
-        assert set(table.column_names) == expected_columns
+        assert set(schema.names) == expected_columns
         db.close()
 
 
@@ -1,121 +1,253 @@
 #!/usr/bin/env python3
 """Unit tests for CheckpointManager."""
 
-import sys
-import tempfile
+from dataclasses import FrozenInstanceError
 from datetime import datetime
-from pathlib import Path
 
 import pytest
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from utils.checkpoint_manager import Checkpoint, CheckpointError, CheckpointManager
 
 
-def test_checkpoint_save_restore():
+def test_checkpoint_save_restore(tmp_path):
     """Test checkpoint save and restore."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        manager = CheckpointManager(checkpoint_dir=tmpdir)
+    manager = CheckpointManager(checkpoint_dir=str(tmp_path))
+
+    # Create checkpoint
+    checkpoint = Checkpoint(
+        date="2025-11-21",
+        last_page=50,
+        total_coins_collected=12500,
+        checkpoint_time=datetime.now().isoformat(),
+        api_calls_used=50,
+        metadata={"status": "test"}
+    )
+
+    # Save
+    filepath = manager.save(checkpoint)
+    assert filepath.exists()
+
+    # Restore
+    restored = manager.restore("2025-11-21")
+    assert restored is not None
+    assert restored.date == "2025-11-21"
+    assert restored.last_page == 50
+    assert restored.total_coins_collected == 12500
+
+
+def test_checkpoint_nonexistent(tmp_path):
+    """Test restoring nonexistent checkpoint."""
+    manager = CheckpointManager(checkpoint_dir=str(tmp_path))
+
+    # Try to restore nonexistent checkpoint
+    restored = manager.restore("2025-01-01")
+    assert restored is None
 
-        # Create checkpoint
-        checkpoint = Checkpoint(
-            date="2025-11-21",
-            last_page=50,
-            total_coins_collected=12500,
-            checkpoint_time=datetime.now().isoformat(),
-            api_calls_used=50,
-            metadata={"status": "test"}
-        )
 
-        # Save
-        filepath = manager.save(checkpoint)
-        assert filepath.exists()
+def test_checkpoint_delete(tmp_path):
+    """Test checkpoint deletion."""
+    manager = CheckpointManager(checkpoint_dir=str(tmp_path))
 
-        # Restore
-        restored = manager.restore("2025-11-21")
-        assert restored is not None
-        assert restored.date == "2025-11-21"
-        assert restored.last_page == 50
-        assert restored.total_coins_collected == 12500
+    # Create and save checkpoint
+    checkpoint = Checkpoint(
+        date="2025-11-21",
+        last_page=10,
+        total_coins_collected=2500,
+        checkpoint_time=datetime.now().isoformat(),
+        api_calls_used=10,
+        metadata={}
+    )
+    manager.save(checkpoint)
 
+    # Delete
+    deleted = manager.delete("2025-11-21")
+    assert deleted is True
 
-def test_checkpoint_nonexistent():
-    """Test restoring nonexistent checkpoint."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        manager = CheckpointManager(checkpoint_dir=tmpdir)
+    # Try to restore after deletion
+    restored = manager.restore("2025-11-21")
+    assert restored is None
 
-        # Try to restore nonexistent checkpoint
-        restored = manager.restore("2025-01-01")
-        assert restored is None
+    # Try to delete again
+    deleted = manager.delete("2025-11-21")
+    assert deleted is False
 
 
-def test_checkpoint_delete():
-    """Test checkpoint deletion."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        manager = CheckpointManager(checkpoint_dir=tmpdir)
+def test_checkpoint_list(tmp_path):
+    """Test listing checkpoints."""
+    manager = CheckpointManager(checkpoint_dir=str(tmp_path))
 
-        # Create and save checkpoint
+    # Create multiple checkpoints
+    dates = ["2025-11-20", "2025-11-21", "2025-11-22"]
+    for date in dates:
         checkpoint = Checkpoint(
-            date="2025-11-21",
-            last_page=10,
-            total_coins_collected=2500,
+            date=date,
+            last_page=1,
+            total_coins_collected=250,
             checkpoint_time=datetime.now().isoformat(),
-            api_calls_used=10,
+            api_calls_used=1,
             metadata={}
         )
         manager.save(checkpoint)
 
-        # Delete
-        deleted = manager.delete("2025-11-21")
-        assert deleted is True
+    # List checkpoints
+    checkpoints = manager.list_checkpoints()
+    assert len(checkpoints) == 3
+    assert checkpoints == sorted(dates)
+
+
+def test_checkpoint_list_index(tmp_path):
+    """Test the checkpoint index is loaded from disk and kept in sync."""
+    for date in ["2025-11-22", "2025-11-20"]:
+        (tmp_path / f"checkpoint_{date}.json").write_text("{}")
+
+    manager = CheckpointManager(checkpoint_dir=str(tmp_path))
+    assert manager.list_checkpoints() == ["2025-11-20", "2025-11-22"]
+
+    checkpoint = Checkpoint(
+        date="2025-11-21",
+        last_page=1,
+        total_coins_collected=250,
+        checkpoint_time=datetime.now().isoformat(),
+        api_calls_used=1,
+        metadata={}
+    )
+    manager.save(checkpoint)
+    manager.save(checkpoint)  # Re-saving the same date does not duplicate it
+    manager.delete("2025-11-22")
+
+    assert manager.list_checkpoints() == ["2025-11-20", "2025-11-21"]
+
+
+def test_checkpoint_save_batch(tmp_path, monkeypatch):
+    """Test saving several checkpoints with a single flush."""
+    manager = CheckpointManager(checkpoint_dir=str(tmp_path))
+    flushes = []
+    monkeypatch.setattr(manager, "_flush", flushes.append)
+
+    dates = ["2025-11-20", "2025-11-21", "2025-11-22"]
+    checkpoints = [
+        Checkpoint(
+            date=date,
+            last_page=1,
+            total_coins_collected=250,
+            checkpoint_time=datetime.now().isoformat(),
+            api_calls_used=1,
+            metadata={}
+        )
+        for date in dates
+    ]
 
-        # Try to restore after deletion
-        restored = manager.restore("2025-11-21")
-        assert restored is None
+    paths = manager.save_batch(checkpoints)
 
-        # Try to delete again
-        deleted = manager.delete("2025-11-21")
-        assert deleted is False
+    assert all(path.exists() for path in paths)
+    assert manager.list_checkpoints() == dates
+    assert flushes == [paths]
 
 
-def test_checkpoint_list():
-    """Test listing checkpoints."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        manager = CheckpointManager(checkpoint_dir=tmpdir)
+def test_checkpoint_bulk_save(tmp_path, monkeypatch):
+    """Test nested bulk_save() blocks flush every save once, at the outermost exit."""
+    manager = CheckpointManager(checkpoint_dir=str(tmp_path))
+    flushes = []
+    monkeypatch.setattr(manager, "_flush", flushes.append)
 
-        # Create multiple checkpoints
-        dates = ["2025-11-20", "2025-11-21", "2025-11-22"]
+    dates = ["2025-11-20", "2025-11-21"]
+    paths = []
+    with manager.bulk_save():
         for date in dates:
-            checkpoint = Checkpoint(
-                date=date,
-                last_page=1,
-                total_coins_collected=250,
-                checkpoint_time=datetime.now().isoformat(),
-                api_calls_used=1,
-                metadata={}
-            )
+            with manager.bulk_save():
+                checkpoint = Checkpoint(
+                    date=date,
+                    last_page=1,
+                    total_coins_collected=250,
+                    checkpoint_time=datetime.now().isoformat(),
+                    api_calls_used=1,
+                    metadata={}
+                )
+                paths.append(manager.save(checkpoint))
+        assert flushes == []
+
+    assert flushes == [paths]
+    assert manager.list_checkpoints() == dates
+
+
+def test_checkpoint_bulk_save_keeps_block_error(tmp_path, monkeypatch):
+    """Test a failing flush does not replace the exception raised in the block."""
+    manager = CheckpointManager(checkpoint_dir=str(tmp_path))
+
+    def failing_flush(paths):
+        raise CheckpointError("Failed to flush checkpoints: disk full")
+
+    monkeypatch.setattr(manager, "_flush", failing_flush)
+    checkpoint = Checkpoint(
+        date="2025-11-21",
+        last_page=1,
+        total_coins_collected=250,
+        checkpoint_time=datetime.now().isoformat(),
+        api_calls_used=1,
+        metadata={}
+    )
+
+    with pytest.raises(ValueError, match="collector failed"):
+        with manager.bulk_save():
+            manager.save(checkpoint)
+            raise ValueError("collector failed")
+
+    # Without an error in the block, the flush failure surfaces
+    with pytest.raises(CheckpointError):
+        with manager.bulk_save():
             manager.save(checkpoint)
 
-        # List checkpoints
-        checkpoints = manager.list_checkpoints()
-        assert len(checkpoints) == 3
-        assert checkpoints == sorted(dates)
+
+def test_checkpoint_interrupted_write(tmp_path):
+    """Test a crash mid-write leaves the previous checkpoint intact."""
+    manager = CheckpointManager(checkpoint_dir=str(tmp_path))
+
+    checkpoint = Checkpoint(
+        date="2025-11-21",
+        last_page=10,
+        total_coins_collected=2500,
+        checkpoint_time=datetime.now().isoformat(),
+        api_calls_used=10,
+        metadata={}
+    )
+    manager.save(checkpoint)
+
+    # Simulate a crash after the temp write but before the atomic rename
+    (tmp_path / "checkpoint_2025-11-21.json.tmp").write_text('{"date": "2025-11-21", "last_pa')
+
+    restored = manager.restore("2025-11-21")
+    assert restored is not None
+    assert restored.last_page == 10
+    assert manager.list_checkpoints() == ["2025-11-21"]
+
+
+def test_checkpoint_is_immutable():
+    """Test checkpoints are frozen, slotted snapshots."""
+    checkpoint = Checkpoint(
+        date="2025-11-21",
+        last_page=1,
+        total_coins_collected=250,
+        checkpoint_time=datetime.now().isoformat(),
+        api_calls_used=1,
+        metadata={}
+    )
+
+    with pytest.raises(FrozenInstanceError):
+        checkpoint.last_page = 2
+    assert not hasattr(checkpoint, "__dict__")
 
 
-def test_checkpoint_validation():
+def test_checkpoint_validation(tmp_path):
     """Test checkpoint validation on restore."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        manager = CheckpointManager(checkpoint_dir=tmpdir)
+    manager = CheckpointManager(checkpoint_dir=str(tmp_path))
 
-        # Create checkpoint with invalid data
-        checkpoint_file = Path(tmpdir) / "checkpoint_2025-11-21.json"
-        checkpoint_file.write_text('{"date": "2025-11-21", "last_page": -1}')  # Invalid: missing fields
+    # Create checkpoint with invalid data
+    checkpoint_file = tmp_path / "checkpoint_2025-11-21.json"
+    checkpoint_file.write_text('{"date": "2025-11-21", "last_page": -1}')  # Invalid: missing fields
 
-        # Should raise on restore
-        with pytest.raises(CheckpointError, match="missing required fields"):
-            manager.restore("2025-11-21")
+    # Should raise on restore
+    with pytest.raises(CheckpointError, match="missing required fields"):
+        manager.restore("2025-11-21")
 
 
 if __name__ == "__main__":
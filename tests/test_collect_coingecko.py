@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Unit tests for the CoinGecko collection tool."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+
+from collect_coingecko import CoinGeckoCollector
+
+
+class FakeResponse:
+    """Minimal stand-in for a successful requests.Response."""
+
+    status_code = 200
+    headers: dict = {}
+
+    def __init__(self, data):
+        self._data = data
+
+    def json(self):
+        return self._data
+
+
+def test_corrupt_cache_entry_is_refetched(tmp_path, monkeypatch):
+    """Test a truncated cache file falls back to the network and is replaced."""
+    monkeypatch.chdir(tmp_path)  # The collector writes its log file under ./logs
+    collector = CoinGeckoCollector(output_dir=str(tmp_path / "out"), delay_override=0, cache_dir=tmp_path / "cache")
+
+    params = {'vs_currency': 'usd', 'days': 365, 'interval': 'daily'}
+    cache_path = collector._cache_path("/coins/bitcoin/market_chart", params)
+    cache_path.parent.mkdir(parents=True)
+    cache_path.write_bytes(b'{"prices": [[1704067200000, 42')
+
+    data = {"prices": [[1704067200000, 42000.0]]}
+    monkeypatch.setattr(collector.session, "get", lambda url, params, timeout: FakeResponse(data))
+
+    assert collector._make_request("/coins/bitcoin/market_chart", dict(params), cache=True) == data
+    assert collector.api_calls_made == 1
+    assert collector.cache_hits == 0
+
+    # The bad entry was replaced by the fresh response
+    assert collector._make_request("/coins/bitcoin/market_chart", dict(params), cache=True) == data
+    assert collector.cache_hits == 1
+
+
+def test_server_error_retried_through_bucket(tmp_path, monkeypatch):
+    """Test a transient 5xx is retried by _make_request, taking a bucket token per attempt."""
+    monkeypatch.chdir(tmp_path)  # The collector writes its log file under ./logs
+    collector = CoinGeckoCollector(output_dir=str(tmp_path / "out"), cache_dir=None)
+
+    acquired = []
+    monkeypatch.setattr(collector.bucket, "acquire", lambda: acquired.append(1))
+    monkeypatch.setattr("collect_coingecko.time.sleep", lambda seconds: None)
+
+    error = FakeResponse(None)
+    error.status_code = 503
+    error.text = "Service Unavailable"
+    responses = iter([error, error, FakeResponse({"ok": True})])
+    monkeypatch.setattr(collector.session, "get", lambda url, params, timeout: next(responses))
+
+    assert collector._make_request("/ping") == {"ok": True}
+    assert collector.api_calls_made == 3
+    assert len(acquired) == 3
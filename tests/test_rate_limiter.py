@@ -1,16 +1,11 @@
 #!/usr/bin/env python3
 """Unit tests for RateLimiter."""
 
-import sys
 import time
-from pathlib import Path
 
 import pytest
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-from utils.rate_limiter import RateLimitConfig, RateLimiter, RateLimitError
+from utils.rate_limiter import CallWindow, RateLimitConfig, RateLimiter, RateLimitError
 
 
 def test_rate_limiter_basic():
@@ -68,8 +63,8 @@ def test_rate_limiter_cleanup():
         limiter.acquire(wait=False)
 
     # Wait for cleanup (simulate 61 seconds passing)
-    now = time.time()
-    limiter.metrics.minute_calls = [now - 61, now - 61, now - 61, now - 61, now - 61]
+    now = time.monotonic()
+    limiter.metrics.minute_calls.reset([now - 61, now - 61, now - 61, now - 61, now - 61])
 
     # Should allow new call after cleanup
     limiter.acquire(wait=False)
@@ -78,5 +73,23 @@ def test_rate_limiter_cleanup():
     assert metrics["minute_calls"] == 1  # Only the new call should remain
 
 
+def test_call_window_wraps_around():
+    """Test ring buffer ordering across wrap-around."""
+    window = CallWindow(capacity=3)
+
+    for timestamp in [1.0, 2.0, 3.0]:
+        window.append(timestamp)
+    window.drop_until(2.0)
+    window.append(4.0)
+    window.append(5.0)  # Wraps past the end of the buffer
+
+    assert len(window) == 3
+    assert window.oldest() == 3.0
+
+    window.drop_until(4.0)
+    assert len(window) == 1
+    assert window.oldest() == 5.0
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -4,18 +4,15 @@ Unit tests for SDK CacheManager.
 GitHub Issue: https://github.com/terrylica/crypto-marketcap-rank/issues/4
 """
 
+import hashlib
 import json
-import sys
 from datetime import date, datetime, timedelta
-from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
-
 from crypto_marketcap_rank.cache import CacheManager
-from crypto_marketcap_rank.github_api import ReleaseInfo
+from crypto_marketcap_rank.github_api import GitHubReleasesClient, ReleaseInfo
 
 
 @pytest.fixture
@@ -49,19 +46,73 @@ class TestCacheManagerInit:
         assert cache_dir.exists()
 
     def test_loads_existing_metadata(self, temp_cache_dir):
-        """Cache manager loads existing metadata."""
-        # Create metadata file
+        """Cache manager replays the JSON Lines metadata log."""
+        entry = {"filename": "test.duckdb", "downloaded_at": datetime.now().isoformat()}
+        records = [
+            {"op": "add", "key": "test-key", "entry": entry},
+            {"op": "add", "key": "gone-key", "entry": entry},
+            {"op": "del", "key": "gone-key"},
+        ]
+        metadata_file = temp_cache_dir / "cache_metadata.jsonl"
+        metadata_file.write_text("".join(json.dumps(r) + "\n" for r in records))
+
+        cache = CacheManager(temp_cache_dir)
+
+        assert "test-key" in cache._metadata
+        assert "gone-key" not in cache._metadata
+
+    def test_migrates_legacy_metadata(self, temp_cache_dir):
+        """Legacy cache_metadata.json is loaded and rewritten as JSONL."""
         metadata = {"test-key": {"filename": "test.duckdb", "downloaded_at": datetime.now().isoformat()}}
-        metadata_file = temp_cache_dir / "cache_metadata.json"
-        with open(metadata_file, "w") as f:
+        legacy_file = temp_cache_dir / "cache_metadata.json"
+        with open(legacy_file, "w") as f:
             json.dump(metadata, f)
 
         cache = CacheManager(temp_cache_dir)
-
         assert "test-key" in cache._metadata
 
+        cache._save_metadata()
+
+        assert not legacy_file.exists()
+        assert CacheManager(temp_cache_dir)._metadata == metadata
+
     def test_handles_corrupted_metadata(self, temp_cache_dir):
-        """Cache manager handles corrupted metadata gracefully."""
+        """Cache manager skips malformed log lines and keeps valid ones."""
+        metadata_file = temp_cache_dir / "cache_metadata.jsonl"
+        good = {"op": "add", "key": "test-key", "entry": {"filename": "test.duckdb"}}
+        metadata_file.write_text(json.dumps(good) + "\ninvalid json{\n")
+
+        cache = CacheManager(temp_cache_dir)
+
+        assert cache._metadata == {"test-key": {"filename": "test.duckdb"}}
+
+    def test_append_after_torn_tail_survives_reload(self, temp_cache_dir):
+        """An append after a newline-less torn record is not lost on reload."""
+        metadata_file = temp_cache_dir / "cache_metadata.jsonl"
+        good = {"op": "add", "key": "a", "entry": {"filename": "a.duckdb"}}
+        metadata_file.write_text(json.dumps(good) + '\n{"op":"add","ke')
+
+        cache = CacheManager(temp_cache_dir)
+        cache._metadata["b"] = {"filename": "b.duckdb"}
+        cache._append_metadata({"op": "add", "key": "b", "entry": {"filename": "b.duckdb"}})
+
+        assert CacheManager(temp_cache_dir)._metadata == {
+            "a": {"filename": "a.duckdb"},
+            "b": {"filename": "b.duckdb"},
+        }
+
+    def test_ignores_interrupted_compaction(self, temp_cache_dir):
+        """A .tmp left by a crash mid-compaction is ignored; the live log is intact."""
+        good = {"op": "add", "key": "test-key", "entry": {"filename": "test.duckdb"}}
+        (temp_cache_dir / "cache_metadata.jsonl").write_text(json.dumps(good) + "\n")
+        (temp_cache_dir / "cache_metadata.jsonl.tmp").write_text('{"op": "add", "ke')
+
+        cache = CacheManager(temp_cache_dir)
+
+        assert cache._metadata == {"test-key": {"filename": "test.duckdb"}}
+
+    def test_handles_corrupted_legacy_metadata(self, temp_cache_dir):
+        """Cache manager handles corrupted legacy metadata gracefully."""
         metadata_file = temp_cache_dir / "cache_metadata.json"
         metadata_file.write_text("invalid json{")
 
@@ -69,6 +120,17 @@ class TestCacheManagerInit:
 
         assert cache._metadata == {}
 
+    def test_appends_one_record_per_mutation(self, cache_manager, temp_cache_dir):
+        """Single-entry updates append to the log instead of rewriting it."""
+        metadata_file = temp_cache_dir / "cache_metadata.jsonl"
+        cache_manager._metadata["a"] = {"filename": "a.duckdb"}
+        cache_manager._append_metadata({"op": "add", "key": "a", "entry": {"filename": "a.duckdb"}})
+        cache_manager._metadata.pop("a")
+        cache_manager._append_metadata({"op": "del", "key": "a"})
+
+        assert len(metadata_file.read_text().splitlines()) == 2
+        assert CacheManager(temp_cache_dir)._metadata == {}
+
 
 class TestCacheManagerGetOrDownload:
     """Test get_or_download functionality."""
@@ -88,12 +150,42 @@ class TestCacheManagerGetOrDownload:
             "downloaded_at": datetime.now().isoformat(),
             "size_bytes": release_info.size_bytes,
             "tag": release_info.tag,
+            "sha256": hashlib.sha256(b"dummy db content").hexdigest(),
         }
 
         result = cache_manager.get_or_download(release_info)
 
         assert result == cached_file
 
+    @pytest.mark.parametrize(
+        ("verify", "expect_download"),
+        [
+            pytest.param(True, True, id="verify"),
+            pytest.param(False, False, id="trusted"),
+        ],
+    )
+    def test_cache_hit_checks_sha256(
+        self, temp_cache_dir, release_info, verify, expect_download
+    ):
+        """Cached file whose SHA-256 no longer matches is re-downloaded when verifying."""
+        cache_manager = CacheManager(temp_cache_dir, verify=verify)
+        cached_file = temp_cache_dir / release_info.asset_name
+        cached_file.write_text("truncated")
+
+        cache_key = f"{release_info.tag}:{release_info.asset_name}"
+        cache_manager._metadata[cache_key] = {
+            "filename": release_info.asset_name,
+            "downloaded_at": datetime.now().isoformat(),
+            "sha256": hashlib.sha256(b"dummy db content").hexdigest(),
+        }
+
+        mock_client = MagicMock(spec=GitHubReleasesClient)
+        mock_client.download_asset.side_effect = lambda rel, dest: dest.write_text("dummy db content")
+
+        cache_manager.get_or_download(release_info, client=mock_client)
+
+        assert mock_client.download_asset.called is expect_download
+
     def test_cache_miss_downloads_file(
         self, cache_manager, release_info, temp_cache_dir
     ):
@@ -101,7 +193,7 @@ class TestCacheManagerGetOrDownload:
         with patch(
             "crypto_marketcap_rank.cache.GitHubReleasesClient"
         ) as mock_client_class:
-            mock_client = MagicMock()
+            mock_client = MagicMock(spec=GitHubReleasesClient)
             mock_client_class.return_value = mock_client
 
             # Mock download to create file
@@ -115,6 +207,21 @@ class TestCacheManagerGetOrDownload:
 
             assert result.exists()
             mock_client.download_asset.assert_called_once()
+            entry = cache_manager._metadata[f"{release_info.tag}:{release_info.asset_name}"]
+            assert entry["sha256"] == hashlib.sha256(b"downloaded content").hexdigest()
+
+    def test_cache_miss_uses_given_client(self, cache_manager, release_info):
+        """A caller-supplied client is reused instead of constructing a new one."""
+        with patch(
+            "crypto_marketcap_rank.cache.GitHubReleasesClient"
+        ) as mock_client_class:
+            mock_client = MagicMock(spec=GitHubReleasesClient)
+            mock_client.download_asset.side_effect = lambda rel, dest: dest.write_text("x")
+
+            cache_manager.get_or_download(release_info, client=mock_client)
+
+            mock_client.download_asset.assert_called_once()
+            mock_client_class.assert_not_called()
 
     def test_force_refresh_redownloads(
         self, cache_manager, release_info, temp_cache_dir
@@ -136,7 +243,7 @@ class TestCacheManagerGetOrDownload:
         with patch(
             "crypto_marketcap_rank.cache.GitHubReleasesClient"
         ) as mock_client_class:
-            mock_client = MagicMock()
+            mock_client = MagicMock(spec=GitHubReleasesClient)
             mock_client_class.return_value = mock_client
 
             def create_file(rel, dest):
@@ -170,7 +277,7 @@ class TestCacheManagerGetOrDownload:
         with patch(
             "crypto_marketcap_rank.cache.GitHubReleasesClient"
         ) as mock_client_class:
-            mock_client = MagicMock()
+            mock_client = MagicMock(spec=GitHubReleasesClient)
             mock_client_class.return_value = mock_client
 
             def create_file(rel, dest):
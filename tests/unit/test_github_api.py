@@ -4,32 +4,35 @@ Unit tests for SDK GitHubReleasesClient.
 GitHub Issue: https://github.com/terrylica/crypto-marketcap-rank/issues/4
 """
 
-import sys
+import io
 from datetime import date
-from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+import requests
+import urllib3
 
 from crypto_marketcap_rank.exceptions import DataNotFoundError, DownloadError
 from crypto_marketcap_rank.github_api import GitHubReleasesClient, ReleaseInfo
 
+MOCK_RELEASE = {
+    "tag_name": "daily-2025-01-15",
+    "assets": [
+        {
+            "name": "crypto_rankings_2025-01-15.duckdb",
+            "url": "https://api.github.com/repos/terrylica/crypto-marketcap-rank/releases/assets/12345",
+            "size": 150_000_000,
+        }
+    ],
+}
 
-@pytest.fixture
-def mock_response():
-    """Mock GitHub API release response."""
-    return {
-        "tag_name": "daily-2025-01-15",
-        "assets": [
-            {
-                "name": "crypto_rankings_2025-01-15.duckdb",
-                "url": "https://api.github.com/repos/terrylica/crypto-marketcap-rank/releases/assets/12345",
-                "size": 150_000_000,
-            }
-        ],
-    }
+
+def make_response(status_code, body=None):
+    """Build a mocked requests.Response with status code and JSON body."""
+    resp = MagicMock(spec=requests.Response)
+    resp.status_code = status_code
+    resp.json.return_value = body
+    return resp
 
 
 @pytest.fixture
@@ -55,21 +58,29 @@ class TestReleaseInfo:
         assert info.date == date(2025, 1, 15)
         assert info.asset_name == "test.duckdb"
 
+    @pytest.mark.parametrize(
+        ("tag", "expected"),
+        [
+            pytest.param("daily-2025-01-15", date(2025, 1, 15), id="daily-tag"),
+            pytest.param("v1.0.0", None, id="non-daily-tag"),
+            pytest.param("daily-2025-13-01", None, id="invalid-date"),
+        ],
+    )
+    def test_parse_release_date(self, client, tag, expected):
+        """Release date comes from the daily-YYYY-MM-DD tag, else today."""
+        info = client._parse_release({**MOCK_RELEASE, "tag_name": tag})
+
+        assert info.date == (expected or date.today())
+
 
 class TestGitHubReleasesClientLatest:
     """Test get_latest_release functionality."""
 
-    def test_get_latest_release_success(self, client, mock_response):
+    def test_get_latest_release_success(self, client):
         """Successfully fetches latest daily release (filters out semantic version tags)."""
         with patch.object(client._session, "get") as mock_get:
-            mock_resp = MagicMock()
-            mock_resp.status_code = 200
-            # API now returns a list of releases, we filter for daily-* tags
-            mock_resp.json.return_value = [
-                mock_response,  # daily-2025-01-15 with DuckDB asset
-                {"tag_name": "v3.0.0", "assets": []},  # Semantic version (no assets)
-            ]
-            mock_get.return_value = mock_resp
+            # API returns a list of releases; semantic version tags are filtered out
+            mock_get.return_value = make_response(200, [MOCK_RELEASE, {"tag_name": "v3.0.0", "assets": []}])
 
             result = client.get_latest_release()
 
@@ -77,42 +88,38 @@ class TestGitHubReleasesClientLatest:
             assert result.tag == "daily-2025-01-15"
             assert result.date == date(2025, 1, 15)
 
-    def test_get_latest_release_404(self, client):
-        """Raises DataNotFoundError when no releases exist."""
-        with patch.object(client._session, "get") as mock_get:
-            mock_resp = MagicMock()
-            mock_resp.status_code = 404
-            mock_get.return_value = mock_resp
-
-            with pytest.raises(DataNotFoundError, match="No releases found"):
-                client.get_latest_release()
-
-    def test_get_latest_release_no_duckdb_asset(self, client):
-        """Raises DataNotFoundError when no daily releases with DuckDB assets."""
+    @pytest.mark.parametrize(
+        ("status_code", "body", "match"),
+        [
+            pytest.param(404, None, "No releases found", id="404"),
+            pytest.param(
+                200,
+                # Only semantic version releases or daily releases without DuckDB
+                [
+                    {"tag_name": "v3.0.0", "assets": []},
+                    {"tag_name": "daily-2025-01-15", "assets": [{"name": "README.md", "url": "...", "size": 100}]},
+                ],
+                "No daily releases with DuckDB",
+                id="no-duckdb-asset",
+            ),
+        ],
+    )
+    def test_get_latest_release_not_found(self, client, status_code, body, match):
+        """Raises DataNotFoundError when no usable daily release exists."""
         with patch.object(client._session, "get") as mock_get:
-            mock_resp = MagicMock()
-            mock_resp.status_code = 200
-            # Only semantic version releases or daily releases without DuckDB
-            mock_resp.json.return_value = [
-                {"tag_name": "v3.0.0", "assets": []},
-                {"tag_name": "daily-2025-01-15", "assets": [{"name": "README.md", "url": "...", "size": 100}]},
-            ]
-            mock_get.return_value = mock_resp
+            mock_get.return_value = make_response(status_code, body)
 
-            with pytest.raises(DataNotFoundError, match="No daily releases with DuckDB"):
+            with pytest.raises(DataNotFoundError, match=match):
                 client.get_latest_release()
 
 
 class TestGitHubReleasesClientByDate:
     """Test get_release_by_date functionality."""
 
-    def test_get_release_by_date_success(self, client, mock_response):
+    def test_get_release_by_date_success(self, client):
         """Successfully fetches release for specific date."""
         with patch.object(client._session, "get") as mock_get:
-            mock_resp = MagicMock()
-            mock_resp.status_code = 200
-            mock_resp.json.return_value = mock_response
-            mock_get.return_value = mock_resp
+            mock_get.return_value = make_response(200, MOCK_RELEASE)
 
             result = client.get_release_by_date(date(2025, 1, 15))
 
@@ -123,11 +130,9 @@ class TestGitHubReleasesClientByDate:
             assert "daily-2025-01-15" in call_url
 
     def test_get_release_by_date_404(self, client):
-        """Raises DataNotFoundError for missing date."""
+        """Raises DataNotFoundError when no release exists for the date."""
         with patch.object(client._session, "get") as mock_get:
-            mock_resp = MagicMock()
-            mock_resp.status_code = 404
-            mock_get.return_value = mock_resp
+            mock_get.return_value = make_response(404)
 
             with pytest.raises(DataNotFoundError, match="No release found for date"):
                 client.get_release_by_date(date(2025, 1, 15))
@@ -148,9 +153,8 @@ class TestGitHubReleasesClientDownload:
         dest_path = temp_cache_dir / "test.duckdb"
 
         with patch.object(client._session, "get") as mock_get:
-            mock_resp = MagicMock()
-            mock_resp.status_code = 200
-            mock_resp.iter_content.return_value = [b"test content"]
+            mock_resp = make_response(200)
+            mock_resp.raw = io.BytesIO(b"test content")
             mock_get.return_value = mock_resp
 
             result = client.download_asset(release, dest_path)
@@ -158,11 +162,10 @@ class TestGitHubReleasesClientDownload:
             assert result == dest_path
             assert dest_path.exists()
             assert dest_path.read_text() == "test content"
+            assert mock_resp.raw.decode_content is True
 
     def test_download_asset_cleans_up_on_failure(self, client, temp_cache_dir):
         """Removes partial file on download failure."""
-        import requests
-
         release = ReleaseInfo(
             tag="daily-2025-01-15",
             date=date(2025, 1, 15),
@@ -180,6 +183,28 @@ class TestGitHubReleasesClientDownload:
 
             assert not dest_path.exists()
 
+    def test_download_asset_cleans_up_on_stream_failure(self, client, temp_cache_dir):
+        """Removes partial file when the body stream breaks mid-download."""
+        release = ReleaseInfo(
+            tag="daily-2025-01-15",
+            date=date(2025, 1, 15),
+            download_url="https://api.github.com/repos/test/releases/assets/123",
+            asset_name="test.duckdb",
+            size_bytes=1000,
+        )
+        dest_path = temp_cache_dir / "test.duckdb"
+
+        with patch.object(client._session, "get") as mock_get:
+            mock_resp = make_response(200)
+            mock_resp.raw = MagicMock()
+            mock_resp.raw.read.side_effect = urllib3.exceptions.ProtocolError("Connection reset")
+            mock_get.return_value = mock_resp
+
+            with pytest.raises(DownloadError):
+                client.download_asset(release, dest_path)
+
+            assert not dest_path.exists()
+
 
 class TestGitHubReleasesClientAuth:
     """Test authentication behavior."""
@@ -4,14 +4,9 @@ Unit tests for Cryptocurrency Rankings Schema V2.
 GitHub Issue: https://github.com/terrylica/crypto-marketcap-rank/issues/4
 """
 
-import sys
-from pathlib import Path
-
 import pyarrow as pa
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
-
 from schemas.crypto_rankings_schema import (
     CRYPTO_RANKINGS_SCHEMA_V2,
     SCHEMA_VERSION,
@@ -139,6 +134,17 @@ class TestSchemaExports:
         assert "rank BIGINT NOT NULL" in ddl
         assert "coin_id VARCHAR NOT NULL" in ddl
 
+    def test_duckdb_ddl_is_cached(self):
+        """DuckDB DDL is generated once and reused."""
+        assert get_duckdb_ddl() is get_duckdb_ddl()
+
+    def test_json_schema_export_is_independent(self):
+        """Each JSON schema export is a fresh dict (safe for callers to mutate)."""
+        first = export_json_schema()
+        first["properties"].pop("rank")
+
+        assert "rank" in export_json_schema()["properties"]
+
 
 class TestSchemaMetadata:
     """Test schema field metadata."""
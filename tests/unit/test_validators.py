@@ -4,17 +4,14 @@ Unit tests for Schema Validators.
 GitHub Issue: https://github.com/terrylica/crypto-marketcap-rank/issues/4
 """
 
-import sys
 from datetime import date
-from pathlib import Path
 
 import pyarrow as pa
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
-
 from schemas.crypto_rankings_schema import CRYPTO_RANKINGS_SCHEMA_V2
-from validators import validate_arrow_table
+from validators import ValidationError, validate_arrow_table, validate_arrow_table_ok
+from validators.schema_validator import validate_and_raise
 
 
 def create_valid_table():
@@ -44,6 +41,12 @@ class TestValidateArrowTable:
         errors = validate_arrow_table(table)
         assert errors == []
 
+    def test_empty_table_passes(self):
+        """Empty table with exact schema passes validation."""
+        table = CRYPTO_RANKINGS_SCHEMA_V2.empty_table()
+        errors = validate_arrow_table(table)
+        assert errors == []
+
     def test_detects_duplicate_coin_ids(self):
         """Validator detects duplicate (date, coin_id) pairs."""
         # Create table with duplicate coin_id on same date
@@ -136,6 +139,58 @@ class TestValidateArrowTable:
         assert len(errors) > 0
         assert any("market_cap" in str(e).lower() or "negative" in str(e).lower() for e in errors)
 
+    def test_schema_level_skips_row_checks(self):
+        """level="schema" checks only the schema; row rules need level="full"."""
+        table = create_valid_table().set_column(1, "rank", pa.array([0], type=pa.int64()))
+
+        assert validate_arrow_table(table, level="schema") == []
+        assert len(validate_arrow_table(table, level="full")) > 0
+
+    def test_schema_level_detects_schema_errors(self):
+        """level="schema" still reports schema mismatches."""
+        table = create_valid_table().drop_columns(["price"])
+
+        errors = validate_arrow_table(table, level="schema")
+
+        assert any("missing columns" in str(e).lower() for e in errors)
+
+    def test_unknown_level_raises(self):
+        """Unknown validation level is a programming error, not a data error."""
+        with pytest.raises(ValueError, match="Unknown validation level"):
+            validate_arrow_table(create_valid_table(), level="fast")
+
+    def test_fail_fast_stops_at_first_failing_rule(self):
+        """fail_fast returns only the first failing rule's errors."""
+        table = (
+            create_valid_table()
+            .set_column(1, "rank", pa.array([0], type=pa.int64()))
+            .set_column(5, "market_cap", pa.array([-1e12]))
+        )
+
+        assert len(validate_arrow_table(table)) == 2
+        errors = validate_arrow_table(table, fail_fast=True)
+        assert len(errors) == 1
+        assert "rank" in str(errors[0]).lower()
+
+    def test_validate_arrow_table_ok(self):
+        """validate_arrow_table_ok reports pass/fail as a bool."""
+        assert validate_arrow_table_ok(create_valid_table()) is True
+        assert validate_arrow_table_ok(create_valid_table().drop_columns(["price"])) is False
+
+
+class TestValidateAndRaise:
+    """Test validate_and_raise wrapper."""
+
+    def test_valid_table_returns_none(self):
+        """Valid table does not raise."""
+        assert validate_and_raise(create_valid_table()) is None
+
+    def test_invalid_table_raises(self):
+        """Invalid table raises a single combined ValidationError."""
+        table = create_valid_table().set_column(1, "rank", pa.array([0], type=pa.int64()))
+        with pytest.raises(ValidationError, match="Validation failed with 1 error"):
+            validate_and_raise(table)
+
 
 class TestValidationRules:
     """Test the 5 validation rules from the plan."""
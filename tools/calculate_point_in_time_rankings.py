@@ -17,46 +17,143 @@ Shows rankings for specific dates to prove we understand the requirement.
 
 import sys
 from pathlib import Path
+from typing import Dict, Optional
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+from pyarrow import csv
 
+# Column types for the crypto2 CSV (skips inference; timestamp parsed by Arrow)
+CRYPTO2_COLUMN_TYPES = {
+    'timestamp': pa.timestamp('s'),
+    'symbol': pa.string(),
+    'name': pa.string(),
+    'market_cap': pa.float64(),
+}
 
-def calculate_rankings_for_date(df: pd.DataFrame, date: str) -> pd.DataFrame:
+# Columns carried into the rankings output (after the computed rank)
+RANKING_COLUMNS = ['symbol', 'name', 'market_cap', 'circulating_supply']
+
+
+def load_crypto2_csv(data_file: Path) -> pd.DataFrame:
+    """
+    Load crypto2 CSV with Arrow's multithreaded reader and typed columns.
+
+    Args:
+        data_file: Path to crypto2 CSV export
+
+    Returns:
+        DataFrame with timestamp already parsed to datetime64
+    """
+    table = csv.read_csv(
+        data_file,
+        convert_options=csv.ConvertOptions(column_types=CRYPTO2_COLUMN_TYPES),
+    )
+    return table.to_pandas()
+
+
+def add_date_column(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Parse timestamps once into a day-precision 'date' column.
+
+    Args:
+        df: DataFrame with a datetime64 timestamp column (see load_crypto2_csv)
+
+    Returns:
+        The same DataFrame with 'date' (datetime64, midnight) added
+    """
+    df['date'] = df['timestamp'].dt.normalize()
+    return df
+
+
+def build_date_index(df: pd.DataFrame) -> Dict[pd.Timestamp, np.ndarray]:
+    """
+    Map each date to the row positions holding it (one hash pass over the table).
+
+    Args:
+        df: DataFrame with a 'date' column (see add_date_column)
+
+    Returns:
+        Dict of date -> positional row indices, for calculate_rankings_for_date
+    """
+    return df.groupby('date', sort=False).indices
+
+
+def top_positions(key: np.ndarray, top_n: Optional[int] = None) -> np.ndarray:
+    """
+    Positions of the top_n smallest keys, in ascending order (NaN last).
+
+    Uses argpartition (O(N)) and sorts only the selected top_n; falls back
+    to a full stable argsort when top_n is None or covers every row. Ties
+    straddling the top_n cut-off may select a different row than a full sort.
+
+    Args:
+        key: Sort key (e.g. negated market caps)
+        top_n: Number of positions to return, or None for all
+
+    Returns:
+        Positional indices into key
+    """
+    if top_n is None or top_n >= len(key):
+        return np.argsort(key, kind='stable')
+    candidates = np.argpartition(key, top_n - 1)[:top_n]
+    return candidates[np.lexsort((candidates, key[candidates]))]
+
+
+def calculate_rankings_for_date(
+    df: pd.DataFrame,
+    date: str,
+    date_index: Optional[Dict[pd.Timestamp, np.ndarray]] = None,
+    top_n: Optional[int] = None,
+) -> pd.DataFrame:
     """
     Calculate rankings for a specific date based on market_cap.
 
     Args:
-        df: DataFrame with columns: timestamp, symbol, name, market_cap
+        df: DataFrame with columns: date (see add_date_column), symbol, name, market_cap
         date: Date string in YYYY-MM-DD format
+        date_index: Optional build_date_index(df) result; turns the per-date
+                    filter into a dict lookup instead of a full-column scan
+        top_n: If set, rank and return only the top_n coins (no full sort)
 
     Returns:
         DataFrame with rankings for that date, sorted by rank
     """
-    # Extract date from timestamp (format: "2013-07-26 23:59:59" -> "2013-07-26")
-    df['date'] = pd.to_datetime(df['timestamp']).dt.strftime('%Y-%m-%d')
-
-    # Filter to specific date
-    date_data = df[df['date'] == date].copy()
+    if date_index is not None:
+        positions = date_index.get(pd.Timestamp(date), np.empty(0, dtype=np.intp))
+    else:
+        # Filter to specific date (datetime64 comparison, no string formatting)
+        positions = np.flatnonzero((df['date'] == pd.Timestamp(date)).to_numpy())
 
-    if len(date_data) == 0:
+    if len(positions) == 0:
         print(f"⚠️  No data for {date}")
         return pd.DataFrame()
 
-    # Sort by market_cap descending and assign rank
-    date_data = date_data.sort_values('market_cap', ascending=False).reset_index(drop=True)
-    date_data['rank'] = range(1, len(date_data) + 1)
+    # Order by market_cap descending (NaN sorts last) and assign rank
+    order = top_positions(-df['market_cap'].to_numpy()[positions], top_n)
 
-    # Select relevant columns
-    result = date_data[['rank', 'symbol', 'name', 'market_cap', 'circulating_supply']].copy()
-
-    # Format market_cap for readability
-    result['market_cap_formatted'] = result['market_cap'].apply(
-        lambda x: f"${x:,.0f}" if pd.notna(x) else "N/A"
-    )
+    # Single gather of the ranked rows and relevant columns only (no intermediate copies);
+    # display formatting is applied only to rows that are shown/saved
+    result = df.iloc[positions[order], df.columns.get_indexer(RANKING_COLUMNS)]
+    result.insert(0, 'rank', np.arange(1, len(result) + 1))
 
     return result
 
 
+def format_market_cap(market_cap: pd.Series) -> pd.Series:
+    """
+    Format market caps as "$1,234,567" strings ("N/A" for missing values).
+
+    Args:
+        market_cap: Series of market cap values
+
+    Returns:
+        Series of formatted strings, same index
+    """
+    return market_cap.map("${:,.0f}".format, na_action="ignore").fillna("N/A")
+
+
 def main():
     # Load crypto2 data
     data_file = Path("data/raw/crypto2/scenario_b_full_20251120_20251120_154741.csv")
@@ -66,7 +163,7 @@ def main():
         sys.exit(1)
 
     print(f"📂 Loading data from: {data_file}")
-    df = pd.read_csv(data_file)
+    df = add_date_column(load_crypto2_csv(data_file))
 
     print(f"✅ Loaded {len(df):,} records")
     print(f"   Date range: {df['timestamp'].min()} to {df['timestamp'].max()}")
@@ -86,32 +183,40 @@ def main():
     print("POINT-IN-TIME HISTORICAL RANKINGS")
     print("="*80)
 
+    # Index rows by date once; each example date is then a dict lookup
+    date_index = build_date_index(df)
+
     for date in example_dates:
-        rankings = calculate_rankings_for_date(df, date)
+        # Only the top 10 are printed, so skip sorting the rest of the day's coins
+        rankings = calculate_rankings_for_date(df, date, date_index, top_n=10)
 
         if len(rankings) == 0:
             continue
+        coin_count = len(date_index[pd.Timestamp(date)])
 
         print(f"\n📅 {date}")
         print("-" * 80)
         print(f"{'Rank':<6} {'Symbol':<10} {'Name':<25} {'Market Cap':>20}")
         print("-" * 80)
 
-        # Show top 10 for that date
-        for _, row in rankings.head(10).iterrows():
-            print(f"{int(row['rank']):<6} {row['symbol']:<10} {row['name']:<25} {row['market_cap_formatted']:>20}")
+        # Show top 10 for that date (format only the rows printed)
+        top_caps = format_market_cap(rankings['market_cap'])
+        for rank, symbol, name, market_cap in zip(rankings['rank'], rankings['symbol'], rankings['name'], top_caps):
+            print(f"{int(rank):<6} {symbol:<10} {name:<25} {market_cap:>20}")
 
-        if len(rankings) > 10:
-            print(f"   ... and {len(rankings) - 10} more coins")
+        if coin_count > 10:
+            print(f"   ... and {coin_count - 10} more coins")
 
     # Save full rankings for a specific date as example
     example_date = "2024-11-20"
-    rankings = calculate_rankings_for_date(df, example_date)
+    rankings = calculate_rankings_for_date(df, example_date, date_index)
 
     if len(rankings) > 0:
+        rankings['market_cap_formatted'] = format_market_cap(rankings['market_cap'])
         output_file = Path(f"data/analysis/point_in_time_rankings_{example_date}.csv")
         output_file.parent.mkdir(parents=True, exist_ok=True)
-        rankings.to_csv(output_file, index=False)
+        # Arrow's C++ CSV writer (streams record batches instead of pandas' Python-level writer)
+        csv.write_csv(pa.Table.from_pandas(rankings, preserve_index=False), output_file)
         print(f"\n✅ Saved full rankings for {example_date} to: {output_file}")
 
     print("\n" + "="*80)
@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 # /// script
 # dependencies = [
+#   "orjson>=3.9.0",
 #   "pandas>=2.0.0",
+#   "python-dateutil>=2.8.0",
 #   "requests>=2.31.0",
 # ]
 # ///
@@ -28,16 +30,62 @@ Exit Codes:
 """
 
 import argparse
+import hashlib
+import json
 import logging
+import logging.handlers
 import os
 import sys
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
+from urllib.parse import urlencode
 
+import numpy as np
 import pandas as pd
 import requests
+from dateutil.tz import tzlocal
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # Optional: fall back to stdlib json
+    orjson = None
+
+
+class TokenBucket:
+    """Thread-safe token bucket shared by all request threads."""
+
+    def __init__(self, capacity: float, refill_rate: float):
+        """
+        Initialize bucket (starts full).
+
+        Args:
+            capacity: Maximum tokens (burst size)
+            refill_rate: Tokens added per second
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.refill_rate
+            time.sleep(wait)
 
 
 class CoinGeckoCollector:
@@ -45,8 +93,25 @@ class CoinGeckoCollector:
 
     BASE_URL = "https://api.coingecko.com/api/v3"
     RATE_LIMIT_DELAY = 4.0  # seconds between requests (15 calls/min - conservative for free tier)
-
-    def __init__(self, api_key: Optional[str] = None, output_dir: str = "data/raw/coingecko", delay_override: Optional[float] = None):
+    MAX_WORKERS = 4  # concurrent requests; overlaps network latency, pacing still set by the bucket
+    MAX_COINS_AHEAD = MAX_WORKERS * 2  # coins submitted beyond the next one to write (bounds held frames)
+    MAX_RATE_LIMIT_DELAY = 60.0  # cap for the delay after repeated 429s
+    RATE_LIMIT_RETRIES = 3  # retries per request on 429 before giving up
+    SERVER_ERROR_CODES = (500, 502, 503, 504)  # transient server errors worth retrying
+    SERVER_ERROR_RETRIES = 3  # retries per request on a transient 5xx before giving up
+    SERVER_ERROR_BACKOFF = 2.0  # seconds before the first 5xx retry, doubled on each further one
+    DELAY_DECREASE_STEP = 0.25  # seconds removed from the delay per successful request
+    LOG_BUFFER_RECORDS = 100  # log records buffered before a log file write
+    CACHE_DIR = Path("data/.cache/coingecko")  # raw /market_chart responses
+    CACHE_TTL = 24 * 3600  # seconds a cached response is reused
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        output_dir: str = "data/raw/coingecko",
+        delay_override: Optional[float] = None,
+        cache_dir: Optional[Path] = CACHE_DIR,
+    ):
         """
         Initialize collector.
 
@@ -54,28 +119,42 @@ class CoinGeckoCollector:
             api_key: Optional CoinGecko Demo API key
             output_dir: Output directory for collected data
             delay_override: Override default rate limit delay (for no-API-key usage)
+            cache_dir: Response cache directory for /market_chart (None disables caching)
         """
         self.api_key = api_key
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
 
-        # Override delay if specified
+        # Override delay if specified (also the floor when recovering from 429 backoff)
         if delay_override is not None:
-            self.rate_limit_delay = delay_override
+            self.min_rate_limit_delay = delay_override
         else:
-            self.rate_limit_delay = self.RATE_LIMIT_DELAY
+            self.min_rate_limit_delay = self.RATE_LIMIT_DELAY
 
         # Setup logging
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         log_file = Path("logs") / f"0001-coingecko-collection-{timestamp}.log"
         log_file.parent.mkdir(exist_ok=True)
 
+        # Log file writes are batched (flushed every LOG_BUFFER_RECORDS records, on
+        # warnings/errors, and at exit); the console still gets every line immediately
+        log_format = logging.Formatter('[%(asctime)s] %(levelname)s - %(message)s')
+        file_target = logging.FileHandler(log_file)
+        file_target.setFormatter(log_format)  # MemoryHandler hands records to its target unformatted
+        file_handler = logging.handlers.MemoryHandler(
+            capacity=self.LOG_BUFFER_RECORDS,
+            flushLevel=logging.WARNING,
+            target=file_target,
+        )
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(log_format)
+
         logging.basicConfig(
             level=logging.INFO,
-            format='[%(asctime)s] %(levelname)s - %(message)s',
             handlers=[
-                logging.FileHandler(log_file),
-                logging.StreamHandler(sys.stdout)
+                file_handler,
+                console_handler
             ]
         )
         self.logger = logging.getLogger(__name__)
@@ -83,17 +162,110 @@ class CoinGeckoCollector:
         self.logger.info(f"Log file: {log_file}")
         self.logger.info("")
 
-        self.collected_data = []
+        # One request every rate_limit_delay seconds (no bursts), shared across worker threads
+        self._pacing_lock = threading.Lock()
+        self.bucket: Optional[TokenBucket] = None
+        self._set_delay(self.min_rate_limit_delay)
+
+        # Persistent session: connections (and TLS) are reused across requests.
+        # The adapter only retries failed connections (nothing reached the server);
+        # 5xx and 429 responses are retried by _make_request, so every resend is paced.
+        # requests already sends Accept-Encoding: gzip, so chart payloads arrive compressed.
+        retry = Retry(connect=3, read=0, status=0, other=0, backoff_factor=2)
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_maxsize=self.MAX_WORKERS, max_retries=retry))
+        self.session.headers["User-Agent"] = "crypto-marketcap-rank (tools/collect_coingecko.py)"
+
         self.api_calls_made = 0
+        self.cache_hits = 0
+        self._calls_lock = threading.Lock()
         self.start_time = None
 
-    def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
+    def _set_delay(self, delay: float) -> None:
+        """Set the delay between requests and re-pace the shared token bucket."""
+        with self._pacing_lock:
+            self.rate_limit_delay = delay
+            if delay <= 0:
+                self.bucket = None
+            elif self.bucket is None:
+                self.bucket = TokenBucket(capacity=1, refill_rate=1 / delay)
+            else:
+                self.bucket.refill_rate = 1 / delay
+
+    def _back_off(self, retry_after: Optional[str]) -> float:
+        """
+        Double the request delay after a 429 (capped).
+
+        Args:
+            retry_after: Retry-After header value, if the server sent one
+
+        Returns:
+            Seconds to wait before retrying (Retry-After when given in seconds)
+        """
+        delay = min(self.MAX_RATE_LIMIT_DELAY, max(self.rate_limit_delay * 2, self.RATE_LIMIT_DELAY))
+        self._set_delay(delay)
+        if retry_after is not None and retry_after.isdigit():
+            return float(retry_after)
+        return delay
+
+    def _ease_off(self) -> None:
+        """Step the delay back toward its configured value after a successful request."""
+        if self.rate_limit_delay > self.min_rate_limit_delay:
+            self._set_delay(max(self.min_rate_limit_delay, self.rate_limit_delay - self.DELAY_DECREASE_STEP))
+
+    def _cache_path(self, endpoint: str, params: Dict) -> Path:
+        """
+        Cache file for a request (API key excluded, so rotating keys keeps the cache).
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+
+        Returns:
+            Path under cache_dir, sharded by the first two hex digits of the key
+        """
+        query = urlencode(sorted((k, v) for k, v in params.items() if k != 'x_cg_demo_api_key'))
+        key = hashlib.blake2b(f"{endpoint}?{query}".encode(), digest_size=16).hexdigest()
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _read_cache(self, cache_path: Path) -> Optional[Dict]:
+        """Return the cached response if present, readable and younger than CACHE_TTL, else None."""
+        try:
+            if time.time() - cache_path.stat().st_mtime > self.CACHE_TTL:
+                return None
+            raw = cache_path.read_bytes()
+        except OSError:
+            return None
+        try:
+            return orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except ValueError as e:  # json and orjson decode errors; drop the entry and refetch
+            self.logger.warning(f"Discarding corrupt response cache {cache_path}: {e}")
+            cache_path.unlink(missing_ok=True)
+            return None
+
+    def _write_cache(self, cache_path: Path, data: Dict) -> None:
+        """Store a response atomically; a failed write only costs a refetch next run."""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(orjson.dumps(data) if orjson is not None else json.dumps(data).encode())
+            tmp_path.replace(cache_path)  # Atomic rename
+        except OSError as e:
+            self.logger.warning(f"Could not write response cache {cache_path}: {e}")
+
+    def _make_request(self, endpoint: str, params: Optional[Dict] = None, cache: bool = False) -> Dict:
         """
         Make API request with rate limiting and error handling.
 
+        On 429 the delay is doubled (Retry-After honoured) and the request
+        retried; each success then steps the delay back down (AIMD). Transient
+        5xx responses are retried with exponential backoff. Every attempt waits
+        for the shared token bucket.
+
         Args:
             endpoint: API endpoint (e.g., "/coins/list")
             params: Query parameters
+            cache: Serve/store the response from cache_dir (CACHE_TTL freshness)
 
         Returns:
             JSON response as dictionary
@@ -106,23 +278,59 @@ class CoinGeckoCollector:
         if params is None:
             params = {}
 
+        cache_path = None
+        if cache and self.cache_dir is not None:
+            cache_path = self._cache_path(endpoint, params)
+            cached = self._read_cache(cache_path)
+            if cached is not None:
+                self.logger.debug(f"Cache hit: {endpoint} ({cache_path})")
+                with self._calls_lock:
+                    self.cache_hits += 1
+                return cached
+
         # Add API key if provided
         if self.api_key:
             params['x_cg_demo_api_key'] = self.api_key
 
-        # Rate limiting
-        if self.api_calls_made > 0:
-            time.sleep(self.rate_limit_delay)
-
         try:
-            self.logger.debug(f"API Request: {url} with params: {params}")
-            response = requests.get(url, params=params, timeout=30)
-            self.api_calls_made += 1
+            rate_limit_retries = server_error_retries = 0
+            while True:
+                # Rate limiting
+                bucket = self.bucket
+                if bucket is not None:
+                    bucket.acquire()
+
+                self.logger.debug(f"API Request: {url} with params: {params}")
+                response = self.session.get(url, params=params, timeout=30)
+                with self._calls_lock:
+                    self.api_calls_made += 1
+
+                if response.status_code == 429 and rate_limit_retries < self.RATE_LIMIT_RETRIES:
+                    rate_limit_retries += 1
+                    wait = self._back_off(response.headers.get('Retry-After'))
+                    self.logger.warning(
+                        f"Rate limited (429) on {endpoint}: waiting {wait:.0f}s, "
+                        f"delay now {self.rate_limit_delay:.1f}s (retry {rate_limit_retries}/{self.RATE_LIMIT_RETRIES})"
+                    )
+                elif (
+                    response.status_code in self.SERVER_ERROR_CODES
+                    and server_error_retries < self.SERVER_ERROR_RETRIES
+                ):
+                    wait = self.SERVER_ERROR_BACKOFF * 2 ** server_error_retries
+                    server_error_retries += 1
+                    self.logger.warning(
+                        f"Server error ({response.status_code}) on {endpoint}: waiting {wait:.0f}s "
+                        f"(retry {server_error_retries}/{self.SERVER_ERROR_RETRIES})"
+                    )
+                else:
+                    break
+                time.sleep(wait)
 
             if response.status_code == 429:
                 raise RuntimeError(
                     f"RATE LIMIT EXCEEDED (429)\n"
                     f"API calls made: {self.api_calls_made}\n"
+                    f"Retries exhausted: {self.RATE_LIMIT_RETRIES}\n"
                     f"CoinGecko free tier limit: 30 calls/minute\n"
                     f"RECOMMENDATION: Increase delay between requests or register for Demo API"
                 )
@@ -135,7 +343,11 @@ class CoinGeckoCollector:
                     f"RECOMMENDATION: Check API status at https://status.coingecko.com/"
                 )
 
-            return response.json()
+            self._ease_off()
+            data = response.json()
+            if cache_path is not None:
+                self._write_cache(cache_path, data)
+            return data
 
         except requests.exceptions.Timeout:
             raise RuntimeError(
@@ -166,16 +378,17 @@ class CoinGeckoCollector:
         self.logger.info(f"Step 1: Retrieving top {top_n} coins...")
 
         # Get market data for top coins (current rankings)
+        per_page = min(top_n, 250)  # CoinGecko max per page
         params = {
             'vs_currency': 'usd',
             'order': 'market_cap_desc',
-            'per_page': min(top_n, 250),  # CoinGecko max per page
+            'per_page': per_page,
             'page': 1,
             'sparkline': 'false'
         }
 
         all_coins = []
-        pages_needed = (top_n + 249) // 250  # Ceiling division
+        pages_needed = (top_n + per_page - 1) // per_page  # Ceiling division
 
         for page in range(1, pages_needed + 1):
             params['page'] = page
@@ -190,7 +403,8 @@ class CoinGeckoCollector:
             all_coins.extend(coins)
             self.logger.info(f"  Retrieved page {page}/{pages_needed}: {len(coins)} coins")
 
-            if len(all_coins) >= top_n:
+            # A short page is the last one; requesting past it only spends rate limit
+            if len(all_coins) >= top_n or len(coins) < per_page:
                 break
 
         # Trim to exact top_n
@@ -204,7 +418,7 @@ class CoinGeckoCollector:
 
         return all_coins
 
-    def collect_historical_data(self, coin_id: str, coin_symbol: str, coin_name: str, days: int = 365) -> List[Dict]:
+    def collect_historical_data(self, coin_id: str, coin_symbol: str, coin_name: str, days: int = 365) -> pd.DataFrame:
         """
         Collect historical market chart data for a single coin.
 
@@ -215,7 +429,7 @@ class CoinGeckoCollector:
             days: Number of days of history (max 365 for free tier)
 
         Returns:
-            List of records with date, symbol, name, price, market_cap, volume
+            DataFrame with date, symbol, name, price, market_cap, volume_24h columns
 
         Raises:
             RuntimeError: If data collection fails
@@ -226,7 +440,7 @@ class CoinGeckoCollector:
             'interval': 'daily'
         }
 
-        data = self._make_request(f"/coins/{coin_id}/market_chart", params)
+        data = self._make_request(f"/coins/{coin_id}/market_chart", params, cache=True)
 
         if 'prices' not in data or 'market_caps' not in data or 'total_volumes' not in data:
             raise RuntimeError(
@@ -236,31 +450,35 @@ class CoinGeckoCollector:
                 f"RECOMMENDATION: Check API response format or skip this coin"
             )
 
-        # Convert to records
-        records = []
-        prices = data['prices']
-        market_caps = data['market_caps']
-        volumes = data['total_volumes']
+        # [timestamp_ms, value] pairs -> (n, 2) float arrays (column-wise, no per-row dicts)
+        prices = np.asarray(data['prices'], dtype=np.float64).reshape(-1, 2)
+        market_caps = np.asarray(data['market_caps'], dtype=np.float64).reshape(-1, 2)
+        volumes = np.asarray(data['total_volumes'], dtype=np.float64).reshape(-1, 2)
 
         # Ensure all arrays same length
         min_length = min(len(prices), len(market_caps), len(volumes))
 
-        for i in range(min_length):
-            timestamp_ms = prices[i][0]
-            date = datetime.fromtimestamp(timestamp_ms / 1000).strftime('%Y-%m-%d')
-
-            records.append({
-                'date': date,
-                'symbol': coin_symbol.upper(),
-                'name': coin_name,
-                'price': prices[i][1],
-                'market_cap': market_caps[i][1],
-                'volume_24h': volumes[i][1],
-                'data_source': 'coingecko',
-                'quality_tier': 'unverified'  # No circulating_supply to verify
-            })
-
-        return records
+        # Dates are taken in local time, like datetime.fromtimestamp (on a UTC host,
+        # the UTC midnight timestamps' own day); NumPy's datetime64 casts then
+        # format YYYY-MM-DD in C (no per-row datetime objects or strftime calls)
+        local_times = pd.to_datetime(prices[:min_length, 0].astype(np.int64), unit='ms', utc=True)
+        local_times = local_times.tz_convert(tzlocal()).tz_localize(None)
+        dates = local_times.to_numpy().astype('datetime64[D]').astype(str)
+
+        # Constant columns are single-category categoricals (one string + a code array)
+        def constant(value: str) -> pd.Categorical:
+            return pd.Categorical.from_codes(np.zeros(min_length, dtype=np.int8), categories=[value])
+
+        return pd.DataFrame({
+            'date': dates,
+            'symbol': constant(coin_symbol.upper()),
+            'name': constant(coin_name),
+            'price': prices[:min_length, 1],
+            'market_cap': market_caps[:min_length, 1],
+            'volume_24h': volumes[:min_length, 1],
+            'data_source': constant('coingecko'),
+            'quality_tier': constant('unverified')  # No circulating_supply to verify
+        })
 
     def run_collection(self, top_n: int = 500, test_mode: bool = False) -> str:
         """
@@ -299,59 +517,89 @@ class CoinGeckoCollector:
         self.logger.info(f"  Estimated time: {estimated_minutes:.1f} minutes")
         self.logger.info("")
 
+        # Generate output filename
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        output_file = self.output_dir / f"market_cap_{timestamp}.csv"
+
         # Step 3: Collect historical data
         self.logger.info("Step 3: Collecting historical data...")
         self.logger.info(f"  (This may take {estimated_minutes:.0f} minutes)")
+        self.logger.info(f"  Streaming to: {output_file}")
         self.logger.info("")
 
         failed_coins = []
-
-        for idx, coin in enumerate(coins, 1):
-            coin_id = coin['id']
-            coin_symbol = coin['symbol']
-            coin_name = coin['name']
-
-            try:
-                self.logger.info(f"  [{idx}/{len(coins)}] Collecting {coin_id} ({coin_symbol.upper()})...")
-                records = self.collect_historical_data(coin_id, coin_symbol, coin_name)
-                self.collected_data.extend(records)
-                self.logger.info(f"    ✅ {len(records)} records")
-
-            except Exception as e:
-                self.logger.error(f"    ❌ Failed: {e}")
-                failed_coins.append({'id': coin_id, 'symbol': coin_symbol, 'error': str(e)})
-                # Continue with next coin instead of stopping
+        total_records = 0
+        symbols = set()
+        min_date = max_date = None
+        ready: Dict[int, Optional[pd.DataFrame]] = {}  # Finished coins waiting on an earlier one
+        in_flight: Dict[Future, int] = {}
+        next_idx = next_submit = done = 0
+
+        # Requests run concurrently; each coin is appended to the CSV once all
+        # earlier coins are written and the file stays in coin (rank) order.
+        # Only coins within MAX_COINS_AHEAD of the next one to write are submitted,
+        # and futures are dropped once consumed, so at most that many frames are held
+        with (
+            open(output_file, 'w', buffering=1 << 20, newline='') as fh,
+            ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as pool,
+        ):
+            while next_idx < len(coins):
+                while next_submit < min(len(coins), next_idx + self.MAX_COINS_AHEAD):
+                    coin = coins[next_submit]
+                    future = pool.submit(self.collect_historical_data, coin['id'], coin['symbol'], coin['name'])
+                    in_flight[future] = next_submit
+                    next_submit += 1
+
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    idx = in_flight.pop(future)
+                    done += 1
+                    coin_id = coins[idx]['id']
+                    coin_symbol = coins[idx]['symbol']
+                    progress = f"  [{done}/{len(coins)}] {coin_id} ({coin_symbol.upper()})"
+
+                    try:
+                        ready[idx] = future.result()
+                        self.logger.info(f"{progress}: ✅ {len(ready[idx])} records")
+
+                    except Exception as e:
+                        ready[idx] = None
+                        self.logger.error(f"{progress}: ❌ Failed: {e}")
+                        failed_coins.append({'id': coin_id, 'symbol': coin_symbol, 'error': str(e)})
+                        # Continue with next coin instead of stopping
+
+                while next_idx in ready:
+                    coin_df = ready.pop(next_idx)
+                    next_idx += 1
+                    if coin_df is None or coin_df.empty:
+                        continue
+
+                    # Header once, with the first rows written
+                    coin_df.to_csv(fh, index=False, header=total_records == 0)
+                    total_records += len(coin_df)
+                    symbols.add(coin_df['symbol'].iat[0])
+                    coin_min, coin_max = coin_df['date'].min(), coin_df['date'].max()
+                    min_date = coin_min if min_date is None else min(min_date, coin_min)
+                    max_date = coin_max if max_date is None else max(max_date, coin_max)
 
         self.logger.info("")
 
-        if not self.collected_data:
+        if total_records == 0:
+            output_file.unlink(missing_ok=True)
             raise RuntimeError(
                 f"No data collected!\n"
                 f"All {len(coins)} coins failed.\n"
                 f"RECOMMENDATION: Check API status and network connection"
             )
 
-        # Step 4: Save to CSV
-        self.logger.info("Step 4: Saving data...")
-
-        df = pd.DataFrame(self.collected_data)
-
-        # Sort by date, symbol
-        df = df.sort_values(['date', 'symbol'])
-
-        # Generate output filename
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        output_file = self.output_dir / f"market_cap_{timestamp}.csv"
-
-        df.to_csv(output_file, index=False)
-
+        # Step 4: Output summary
         file_size_mb = output_file.stat().st_size / (1024 * 1024)
 
         self.logger.info(f"✅ Saved to: {output_file}")
-        self.logger.info(f"  Records: {len(df):,}")
+        self.logger.info(f"  Records: {total_records:,}")
         self.logger.info(f"  File size: {file_size_mb:.1f} MB")
-        self.logger.info(f"  Date range: {df['date'].min()} to {df['date'].max()}")
-        self.logger.info(f"  Unique coins: {df['symbol'].nunique()}")
+        self.logger.info(f"  Date range: {min_date} to {max_date}")
+        self.logger.info(f"  Unique coins: {len(symbols)}")
         self.logger.info("")
 
         # Step 5: Collection summary
@@ -361,10 +609,11 @@ class CoinGeckoCollector:
         self.logger.info("COLLECTION SUMMARY")
         self.logger.info("="*60)
         self.logger.info(f"Coins requested:    {len(coins)}")
-        self.logger.info(f"Coins collected:    {df['symbol'].nunique()}")
+        self.logger.info(f"Coins collected:    {len(symbols)}")
         self.logger.info(f"Coins failed:       {len(failed_coins)}")
-        self.logger.info(f"Total records:      {len(df):,}")
+        self.logger.info(f"Total records:      {total_records:,}")
         self.logger.info(f"API calls made:     {self.api_calls_made}")
+        self.logger.info(f"Cached responses:   {self.cache_hits}")
         self.logger.info(f"Collection time:    {collection_time_minutes:.1f} minutes")
         self.logger.info(f"Output file:        {output_file}")
         self.logger.info("")
@@ -416,6 +665,12 @@ def main():
         type=float,
         help='Override rate limit delay in seconds (e.g., 20.0 for no-API-key usage)'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help=f'Refetch every coin instead of reusing /market_chart responses from the last '
+             f'{CoinGeckoCollector.CACHE_TTL // 3600}h ({CoinGeckoCollector.CACHE_DIR})'
+    )
 
     args = parser.parse_args()
 
@@ -429,7 +684,12 @@ def main():
         print("")
 
     try:
-        collector = CoinGeckoCollector(api_key=api_key, output_dir=args.output, delay_override=args.delay)
+        collector = CoinGeckoCollector(
+            api_key=api_key,
+            output_dir=args.output,
+            delay_override=args.delay,
+            cache_dir=None if args.no_cache else CoinGeckoCollector.CACHE_DIR,
+        )
         output_file = collector.run_collection(top_n=args.top_n, test_mode=args.test)
 
         print("")
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 # /// script
 # dependencies = [
+#   "orjson>=3.9.0",
 #   "requests>=2.31.0",
 # ]
 # ///
@@ -17,6 +18,14 @@ import time
 
 import requests
 
+try:
+    import orjson
+except ImportError:  # Optional: fall back to stdlib json
+    orjson = None
+
+RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_WAIT = 30  # seconds, when a 429 carries no Retry-After
+
 # Use API key if available
 api_key = os.getenv('COINGECKO_API_KEY')
 
@@ -28,11 +37,18 @@ if api_key:
     print("✅ Using Demo API key")
 else:
     print("⚠️  No API key (using free tier)")
-    time.sleep(60)  # Wait to avoid rate limit
 
 print("Fetching all active coins from CoinGecko...")
 
-response = requests.get(url, params=params, timeout=30)
+# Single request: only wait if the API actually rate-limits us (honour Retry-After)
+for attempt in range(RATE_LIMIT_RETRIES + 1):
+    response = requests.get(url, params=params, timeout=30)
+    if response.status_code != 429 or attempt == RATE_LIMIT_RETRIES:
+        break
+    retry_after = response.headers.get('Retry-After', '')
+    wait = int(retry_after) if retry_after.isdigit() else RATE_LIMIT_WAIT
+    print(f"⚠️  Rate limit hit, waiting {wait} seconds (retry {attempt + 1}/{RATE_LIMIT_RETRIES})...")
+    time.sleep(wait)
 
 if response.status_code != 200:
     print(f"❌ Error: {response.status_code}")
@@ -45,8 +61,12 @@ print(f"✅ Retrieved {len(coins):,} active coins")
 
 # Save to file
 output_file = 'data/coingecko_all_coin_ids.json'
-with open(output_file, 'w') as f:
-    json.dump(coins, f, indent=2)
+if orjson is not None:
+    with open(output_file, 'wb') as f:
+        f.write(orjson.dumps(coins, option=orjson.OPT_INDENT_2))
+else:
+    with open(output_file, 'w') as f:
+        json.dump(coins, f, indent=2)
 
 print(f"✅ Saved to: {output_file}")
 
@@ -57,7 +77,7 @@ for coin in coins[:10]:
 
 # Look for old/dead coins
 print("\nSearching for historically important dead coins...")
-targets = ['namecoin', 'peercoin', 'terracoin', 'novacoin', 'feathercoin']
+targets = frozenset(['namecoin', 'peercoin', 'terracoin', 'novacoin', 'feathercoin'])
 found = [c for c in coins if c['id'] in targets]
 
 if found:
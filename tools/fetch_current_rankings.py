@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 # /// script
 # dependencies = [
+#   "orjson>=3.9.0",
+#   "pandas>=2.0.0",
 #   "requests>=2.31.0",
 # ]
 # ///
@@ -20,8 +22,34 @@ import time
 from datetime import datetime
 from pathlib import Path
 
+import pandas as pd
 import requests
 
+try:
+    import orjson
+except ImportError:  # Optional: fall back to stdlib json
+    orjson = None
+
+# CoinGecko /coins/markets field -> CSV column, in CSV order
+CSV_COLUMNS = {
+    'market_cap_rank': 'rank',
+    'id': 'id',
+    'symbol': 'symbol',
+    'name': 'name',
+    'market_cap': 'market_cap',
+    'current_price': 'price',
+    'total_volume': 'volume_24h',
+}
+
+
+def write_json(obj, path: Path):
+    """Write obj as indented JSON (orjson's C encoder when installed)."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, 'w') as f:
+        json.dump(obj, f, indent=2)
+
 
 def fetch_current_rankings(top_n: int = 500, use_api_key: bool = True):
     """
@@ -84,7 +112,12 @@ def fetch_current_rankings(top_n: int = 500, use_api_key: bool = True):
             all_coins.extend(coins)
 
             print(f"   ✅ Fetched {len(coins)} coins")
-            print(f"      Sample: #{coins[0]['market_cap_rank']} {coins[0]['symbol'].upper()} = ${coins[0]['market_cap']:,.0f}")
+            if coins:
+                print(f"      Sample: #{coins[0]['market_cap_rank']} {coins[0]['symbol'].upper()} = ${coins[0]['market_cap']:,.0f}")
+
+            # A short page is the last one; requesting past it only spends rate limit
+            if len(coins) < per_page:
+                break
 
             # Wait between requests (except after last page)
             if page < pages_needed:
@@ -114,16 +147,16 @@ def save_rankings(coins, output_dir: str = "data/rankings"):
 
     # Save full JSON
     json_file = output_path / f"current_rankings_{timestamp}.json"
-    with open(json_file, 'w') as f:
-        json.dump(coins, f, indent=2)
+    write_json(coins, json_file)
     print(f"\n💾 Saved full data to: {json_file}")
 
     # Save simplified CSV (rank, id, symbol, name, market_cap)
     csv_file = output_path / f"current_rankings_{timestamp}.csv"
-    with open(csv_file, 'w') as f:
-        f.write("rank,id,symbol,name,market_cap,price,volume_24h\n")
-        for coin in coins:
-            f.write(f"{coin['market_cap_rank']},{coin['id']},{coin['symbol']},{coin['name']},{coin['market_cap']},{coin['current_price']},{coin['total_volume']}\n")
+    # pandas' C writer quotes names containing commas and writes missing values as empty;
+    # nullable Int64 keeps ranks as integers when some coins are unranked
+    rankings = pd.DataFrame(coins, columns=list(CSV_COLUMNS)).rename(columns=CSV_COLUMNS)
+    rankings['rank'] = rankings['rank'].astype('Int64')
+    rankings.to_csv(csv_file, index=False)
     print(f"💾 Saved CSV to: {csv_file}")
 
     # Save summary
@@ -144,8 +177,7 @@ def save_rankings(coins, output_dir: str = "data/rankings"):
     }
 
     summary_file = output_path / f"summary_{timestamp}.json"
-    with open(summary_file, 'w') as f:
-        json.dump(summary, f, indent=2)
+    write_json(summary, summary_file)
     print(f"💾 Saved summary to: {summary_file}")
 
     return json_file, csv_file, summary_file
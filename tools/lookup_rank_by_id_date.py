@@ -13,10 +13,120 @@ Usage:
     uv run tools/lookup_rank_by_id_date.py litecoin 2017-12-17
 """
 
+import datetime
 import sys
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from pyarrow import csv
+
+# Columns read from the crypto2 CSV (any others are never converted).
+# symbol/name are dictionary-encoded: repeated strings load as pandas categoricals.
+CRYPTO2_COLUMN_TYPES = {
+    'timestamp': pa.timestamp('s'),
+    'symbol': pa.dictionary(pa.int32(), pa.string()),
+    'name': pa.dictionary(pa.int32(), pa.string()),
+    'market_cap': pa.float64(),
+    'circulating_supply': pa.float64(),
+}
+
+# Parquet snapshot of CRYPTO2_COLUMN_TYPES (built on first lookup, rebuilt when the CSV changes)
+CACHE_FILE = Path("data/.cache/crypto2_lookup.parquet")
+CACHE_ROW_GROUP_SIZE = 64 * 1024  # Sorted by timestamp: row-group stats let a date filter skip the rest
+
+# Common coin names -> symbols (crypto2 uses symbols not IDs)
+COIN_SYMBOLS = {
+    'bitcoin': 'BTC',
+    'litecoin': 'LTC',
+    'ripple': 'XRP',
+    'xrp': 'XRP',
+    'dogecoin': 'DOGE',
+    'ethereum': 'ETH',
+    'monero': 'XMR',
+    'dash': 'DASH',
+    'stellar': 'XLM',
+    'namecoin': 'NMC',
+    'peercoin': 'PPC',
+    'novacoin': 'NVC',
+    'feathercoin': 'FTC',
+    'primecoin': 'XPM',
+    'terracoin': 'TRC',
+}
+
+
+def open_crypto2_dataset(data_file: Path, cache_file: Path = CACHE_FILE) -> ds.Dataset:
+    """
+    Open the crypto2 data for lookup, preferring the Parquet snapshot.
+
+    The snapshot holds only CRYPTO2_COLUMN_TYPES, sorted by timestamp, so a
+    date filter reads just the row groups for that day. It is rebuilt when
+    the CSV is newer; if it cannot be written, the CSV is scanned directly.
+
+    Args:
+        data_file: Path to crypto2 CSV export
+        cache_file: Parquet snapshot location
+
+    Returns:
+        Dataset with CRYPTO2_COLUMN_TYPES applied
+    """
+    if cache_file.exists() and cache_file.stat().st_mtime >= data_file.stat().st_mtime:
+        return ds.dataset(cache_file, format='parquet')
+
+    convert_options = csv.ConvertOptions(column_types=CRYPTO2_COLUMN_TYPES)
+    csv_dataset = ds.dataset(data_file, format=ds.CsvFileFormat(convert_options=convert_options))
+
+    try:
+        table = csv_dataset.to_table(columns=list(CRYPTO2_COLUMN_TYPES)).sort_by('timestamp')
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix('.parquet.tmp')
+        pq.write_table(table, tmp_file, row_group_size=CACHE_ROW_GROUP_SIZE)
+        tmp_file.replace(cache_file)  # Atomic rename
+        print(f"📦 Cached lookup data: {cache_file}")
+    except OSError as e:
+        print(f"⚠️  Could not write lookup cache ({e}); scanning CSV")
+        return csv_dataset
+
+    return ds.dataset(cache_file, format='parquet')
+
+
+def load_crypto2_day(dataset: ds.Dataset, day: datetime.date) -> pd.DataFrame:
+    """
+    Load one day's rows, filtering during the scan so other days are never materialized.
+
+    Args:
+        dataset: Dataset from open_crypto2_dataset
+        day: Date to load
+
+    Returns:
+        DataFrame with timestamp (datetime64), categorical symbol/name, market_cap, circulating_supply
+    """
+    start = datetime.datetime.combine(day, datetime.time())
+    end = start + datetime.timedelta(days=1)
+    timestamp = ds.field('timestamp')
+    in_day = (timestamp >= pa.scalar(start, CRYPTO2_COLUMN_TYPES['timestamp'])) & (
+        timestamp < pa.scalar(end, CRYPTO2_COLUMN_TYPES['timestamp'])
+    )
+    return dataset.to_table(columns=list(CRYPTO2_COLUMN_TYPES), filter=in_day).to_pandas()
+
+
+def crypto2_date_range(dataset: ds.Dataset) -> tuple:
+    """
+    Summarize the dates available in the dataset (reads the timestamp column only).
+
+    Args:
+        dataset: Dataset from open_crypto2_dataset
+
+    Returns:
+        Tuple of (first date, last date, number of distinct dates)
+    """
+    days = pc.cast(dataset.to_table(columns=['timestamp'])['timestamp'], pa.date32())
+    bounds = pc.min_max(days).as_py()
+    return bounds['min'], bounds['max'], pc.count_distinct(days).as_py()
 
 
 def get_rank_for_coin_on_date(coin_id: str, date: str) -> dict:
@@ -36,51 +146,30 @@ def get_rank_for_coin_on_date(coin_id: str, date: str) -> dict:
     if not data_file.exists():
         return {"error": "Data file not found", "file": str(data_file)}
 
-    df = pd.read_csv(data_file)
-
-    # Map common coin names to symbols (crypto2 uses symbols not IDs)
-    coin_map = {
-        'bitcoin': 'BTC',
-        'litecoin': 'LTC',
-        'ripple': 'XRP',
-        'xrp': 'XRP',
-        'dogecoin': 'DOGE',
-        'ethereum': 'ETH',
-        'monero': 'XMR',
-        'dash': 'DASH',
-        'stellar': 'XLM',
-        'namecoin': 'NMC',
-        'peercoin': 'PPC',
-        'novacoin': 'NVC',
-        'feathercoin': 'FTC',
-        'primecoin': 'XPM',
-        'terracoin': 'TRC',
-    }
+    dataset = open_crypto2_dataset(data_file)
 
     # Try to find symbol
-    symbol = coin_map.get(coin_id.lower())
+    symbol = COIN_SYMBOLS.get(coin_id.lower())
     if not symbol:
         # Try using coin_id directly as symbol
         symbol = coin_id.upper()
 
-    # Extract date from timestamp
-    df['date'] = pd.to_datetime(df['timestamp']).dt.strftime('%Y-%m-%d')
-
-    # Filter to specific date
-    date_data = df[df['date'] == date].copy()
+    # Read only this date's rows (the filter runs on each CSV batch during the scan)
+    try:
+        day = datetime.date.fromisoformat(date)
+    except ValueError:
+        day = None
+    date_data = load_crypto2_day(dataset, day) if day is not None else pd.DataFrame()
 
     if len(date_data) == 0:
+        first_date, last_date, total_dates = crypto2_date_range(dataset)
         return {
             "error": "No data for this date",
             "date": date,
-            "available_range": f"{df['date'].min()} to {df['date'].max()}",
-            "total_dates": df['date'].nunique()
+            "available_range": f"{first_date} to {last_date}",
+            "total_dates": total_dates
         }
 
-    # Calculate rankings for this date
-    date_data = date_data.sort_values('market_cap', ascending=False).reset_index(drop=True)
-    date_data['rank'] = range(1, len(date_data) + 1)
-
     # Find the specific coin
     coin_data = date_data[date_data['symbol'] == symbol]
 
@@ -95,14 +184,22 @@ def get_rank_for_coin_on_date(coin_id: str, date: str) -> dict:
             "total_coins": len(available_coins)
         }
 
+    # Rank = 1 + coins with a larger market cap that day (one linear scan, no sort);
+    # coins without a market cap rank after every coin that has one
+    coin_row = coin_data.sort_values('market_cap', ascending=False).iloc[0]
+    market_caps = date_data['market_cap'].to_numpy()
+    if pd.isna(coin_row['market_cap']):
+        rank = int(np.count_nonzero(~np.isnan(market_caps))) + 1
+    else:
+        rank = int(np.count_nonzero(market_caps > coin_row['market_cap'])) + 1
+
     # Return rank info
-    coin_row = coin_data.iloc[0]
     return {
         "coin_id": coin_id,
         "symbol": coin_row['symbol'],
         "name": coin_row['name'],
         "date": date,
-        "rank": int(coin_row['rank']),
+        "rank": rank,
         "market_cap": float(coin_row['market_cap']),
         "market_cap_formatted": f"${coin_row['market_cap']:,.0f}",
         "circulating_supply": float(coin_row['circulating_supply']) if pd.notna(coin_row['circulating_supply']) else None,
@@ -3,6 +3,7 @@
 # dependencies = [
 #   "pandas>=2.0.0",
 #   "numpy>=1.24.0",
+#   "pyarrow>=14.0.0",
 # ]
 # ///
 """
@@ -18,7 +19,7 @@ Strategy:
 4. Merge with priority: Kaggle (verified) > crypto2 (verified) > CoinGecko (unverified)
 5. Remove duplicate (date, symbol) combinations
 6. Sort by date and rank
-7. Save final dataset with metadata
+7. Save final dataset (CSV + Parquet, optional .csv.gz) with metadata
 
 Quality Tiers:
 - verified: Has circulating_supply field to verify market_cap = price × supply
@@ -29,7 +30,8 @@ Usage:
         --kaggle data/raw/kaggle/historical_data.csv \\
         --crypto2 data/raw/crypto2/scenario_a_gap_*.csv \\
         --coingecko data/raw/coingecko/market_cap.csv \\
-        --output data/final/crypto_historical_marketcap_ranked.csv
+        --output data/final/crypto_historical_marketcap_ranked.csv \\
+        --gzip
 
 Exit Codes:
     0: Merge successful
@@ -37,15 +39,106 @@ Exit Codes:
 """
 
 import argparse
+import gzip
 import json
 import logging
+import shutil
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+from pyarrow import csv
+
+UNDATED_MONTH = np.iinfo(np.int64).max  # Month key for rows without a date (merged last)
+CSV_BLOCK_SIZE = 1 << 20  # bytes parsed per block by read_csv_arrow
+
+# Raw CSV column types per source (other columns are inferred). Dates are parsed once,
+# here, by Arrow; symbols stay strings so Arrow does not infer numbers; numeric columns are
+# pinned to float64 so a later block with decimals cannot contradict an integer type
+# inferred from the first block.
+KAGGLE_COLUMN_TYPES = {
+    'Date': pa.timestamp('s'),
+    'Symbol': pa.string(),
+    'Close': pa.float64(),
+    'Volume': pa.float64(),
+    'Market Cap': pa.float64(),
+}
+CRYPTO2_COLUMN_TYPES = {
+    'timestamp': pa.timestamp('s'),
+    'coin_symbol': pa.string(),
+    'price': pa.float64(),
+    'volume_24h': pa.float64(),
+    'market_cap': pa.float64(),
+    'circulating_supply': pa.float64(),
+}
+COINGECKO_COLUMN_TYPES = {
+    'date': pa.timestamp('s'),
+    'id': pa.string(),
+    'symbol': pa.string(),
+    'current_price': pa.float64(),
+    'price': pa.float64(),
+    'total_volume': pa.float64(),
+    'volume_24h': pa.float64(),
+    'market_cap': pa.float64(),
+}
+
+
+def read_csv_arrow(csv_path: Path, column_types: Dict[str, pa.DataType]) -> pd.DataFrame:
+    """
+    Read a CSV with Arrow's streaming reader, one CSV_BLOCK_SIZE block at a time.
+
+    Peak memory stays close to the parsed data itself; csv.read_csv parses the
+    whole file at once and holds several times that in parse buffers.
+
+    Args:
+        csv_path: CSV file to read
+        column_types: Types for known columns (absent columns are ignored)
+
+    Returns:
+        DataFrame converted from the Arrow table
+    """
+    # strings_can_be_null: empty cells are missing values, as with pd.read_csv
+    convert_options = csv.ConvertOptions(column_types=column_types, strings_can_be_null=True)
+    read_options = csv.ReadOptions(block_size=CSV_BLOCK_SIZE)
+    return csv.open_csv(csv_path, read_options=read_options, convert_options=convert_options).read_all().to_pandas()
+
+
+def format_date_range(dates: pd.Series) -> Tuple[Optional[str], Optional[str]]:
+    """
+    First and last date as YYYY-MM-DD strings (for the JSON metadata).
+
+    Args:
+        dates: datetime64 date column
+
+    Returns:
+        Tuple of (first, last); None when there are no dates
+    """
+    return tuple(None if pd.isna(d) else d.strftime('%Y-%m-%d') for d in (dates.min(), dates.max()))
+
+
+def build_month_index(dates: pd.Series) -> Dict[int, np.ndarray]:
+    """
+    Map each calendar month to the row positions holding it (one hash pass).
+
+    Args:
+        dates: datetime64 date column
+
+    Returns:
+        Dict of month number (months since 1970-01) -> positional row indices;
+        rows without a date are keyed UNDATED_MONTH
+    """
+    months = dates.to_numpy().astype('datetime64[M]').astype(np.int64)
+    months[dates.isna().to_numpy()] = UNDATED_MONTH
+    return pd.DataFrame({'month': months}).groupby('month', sort=False).indices
+
+
+def constant_categorical(value: str, dtype: pd.CategoricalDtype, length: int) -> pd.Categorical:
+    """Categorical holding value on every row (an int8 code array, no per-row strings)."""
+    return pd.Categorical.from_codes(np.full(length, dtype.categories.get_loc(value), dtype=np.int8), dtype=dtype)
 
 
 class DatasetMerger:
@@ -65,6 +158,10 @@ class DatasetMerger:
         'quality_tier': 'quality_tier'
     }
 
+    # Category order is merge priority (first wins): quality_tier, then data_source
+    TIER_DTYPE = pd.CategoricalDtype(['verified', 'unverified'])
+    SOURCE_DTYPE = pd.CategoricalDtype(['kaggle', 'crypto2', 'coingecko'])
+
     def __init__(self, output_dir: str = 'data/final'):
         """Initialize merger."""
         self.output_dir = Path(output_dir)
@@ -101,7 +198,7 @@ class DatasetMerger:
         logger.info(f"Loading Kaggle dataset from {csv_path}")
 
         try:
-            df = pd.read_csv(csv_path)
+            df = read_csv_arrow(csv_path, KAGGLE_COLUMN_TYPES)
             logger.info(f"  Loaded {len(df):,} rows")
 
             # Standardize column names (Kaggle specific mapping)
@@ -118,15 +215,18 @@ class DatasetMerger:
             # Rename columns
             df = df.rename(columns=column_mapping)
 
-            # Add data source and quality tier
-            df['data_source'] = 'kaggle'
-            df['quality_tier'] = 'verified'  # Kaggle has historical snapshots
+            # Add data source and quality tier (Kaggle has historical snapshots)
+            df['data_source'] = constant_categorical('kaggle', self.SOURCE_DTYPE, len(df))
+            df['quality_tier'] = constant_categorical('verified', self.TIER_DTYPE, len(df))
 
             # Ensure required columns exist
             for col in ['date', 'symbol', 'price_usd', 'market_cap_usd']:
                 if col not in df.columns:
                     raise ValueError(f"Missing required column after mapping: {col}")
 
+            # Each symbol repeats on every date: store it once per coin
+            df['symbol'] = df['symbol'].astype('category')
+
             # Add circulating_supply if missing (calculate from price and mcap)
             if 'circulating_supply' not in df.columns:
                 df['circulating_supply'] = df['market_cap_usd'] / df['price_usd']
@@ -137,7 +237,7 @@ class DatasetMerger:
             self.metadata['sources']['kaggle'] = {
                 'file': str(csv_path),
                 'records': len(df),
-                'date_range': (df['date'].min(), df['date'].max()),
+                'date_range': format_date_range(df['date']),
                 'unique_coins': df['symbol'].nunique()
             }
 
@@ -177,7 +277,7 @@ class DatasetMerger:
         logger.info(f"Loading crypto2 dataset from {csv_path}")
 
         try:
-            df = pd.read_csv(csv_path)
+            df = read_csv_arrow(csv_path, CRYPTO2_COLUMN_TYPES)
             logger.info(f"  Loaded {len(df):,} rows")
 
             # Standardize column names (crypto2 specific mapping)
@@ -195,27 +295,30 @@ class DatasetMerger:
             # Rename columns
             df = df.rename(columns=column_mapping)
 
-            # Add data source and quality tier
-            df['data_source'] = 'crypto2'
-            df['quality_tier'] = 'verified'  # crypto2 has circulating_supply
+            # Add data source and quality tier (crypto2 has circulating_supply)
+            df['data_source'] = constant_categorical('crypto2', self.SOURCE_DTYPE, len(df))
+            df['quality_tier'] = constant_categorical('verified', self.TIER_DTYPE, len(df))
 
             # Ensure required columns exist
             for col in ['date', 'symbol', 'price_usd', 'market_cap_usd']:
                 if col not in df.columns:
                     raise ValueError(f"Missing required column after mapping: {col}")
 
+            # Each symbol repeats on every date: store it once per coin
+            df['symbol'] = df['symbol'].astype('category')
+
             # Verify circulating_supply exists
             if 'circulating_supply' not in df.columns:
                 logger.warning("  ⚠️  crypto2 missing circulating_supply - marking as unverified")
                 df['circulating_supply'] = np.nan
-                df['quality_tier'] = 'unverified'
+                df['quality_tier'] = constant_categorical('unverified', self.TIER_DTYPE, len(df))
 
             logger.info("  ✅ crypto2 dataset standardized")
 
             self.metadata['sources']['crypto2'] = {
                 'file': str(csv_path),
                 'records': len(df),
-                'date_range': (df['date'].min(), df['date'].max()),
+                'date_range': format_date_range(df['date']),
                 'unique_coins': df['symbol'].nunique()
             }
 
@@ -248,7 +351,7 @@ class DatasetMerger:
         logger.info(f"Loading CoinGecko dataset from {csv_path}")
 
         try:
-            df = pd.read_csv(csv_path)
+            df = read_csv_arrow(csv_path, COINGECKO_COLUMN_TYPES)
             logger.info(f"  Loaded {len(df):,} rows")
 
             # Standardize column names (CoinGecko specific mapping)
@@ -257,6 +360,7 @@ class DatasetMerger:
                 'id': 'symbol',  # CoinGecko uses 'id' not symbol
                 'name': 'name',
                 'current_price': 'price_usd',
+                'price': 'price_usd',  # tools/collect_coingecko.py output
                 'total_volume': 'volume_24h',
                 'market_cap': 'market_cap_usd',
                 'market_cap_rank': 'rank',
@@ -265,30 +369,37 @@ class DatasetMerger:
             # Rename columns
             df = df.rename(columns=column_mapping)
 
-            # Add data source and quality tier
-            df['data_source'] = 'coingecko'
-            df['quality_tier'] = 'unverified'  # CoinGecko free tier has no circulating_supply
+            # Add data source and quality tier (CoinGecko free tier has no circulating_supply)
+            df['data_source'] = constant_categorical('coingecko', self.SOURCE_DTYPE, len(df))
+            df['quality_tier'] = constant_categorical('unverified', self.TIER_DTYPE, len(df))
 
             # Ensure required columns exist
             for col in ['date', 'symbol', 'price_usd', 'market_cap_usd']:
                 if col not in df.columns:
                     raise ValueError(f"Missing required column after mapping: {col}")
 
+            # Each symbol repeats on every date: store it once per coin
+            df['symbol'] = df['symbol'].astype('category')
+
             # Add empty circulating_supply column
             if 'circulating_supply' not in df.columns:
                 df['circulating_supply'] = np.nan
 
+            # Historical market_chart data carries no rank (months merged without another source still sort by it)
+            if 'rank' not in df.columns:
+                df['rank'] = np.nan
+
             logger.info("  ✅ CoinGecko dataset standardized")
             logger.info("  ⚠️  Quality tier: unverified (no circulating_supply)")
 
             self.metadata['sources']['coingecko'] = {
                 'file': str(csv_path),
                 'records': len(df),
-                'date_range': (df['date'].min(), df['date'].max()),
+                'date_range': format_date_range(df['date']),
                 'unique_coins': df['symbol'].nunique()
             }
 
-            return None
+            return df
 
         except Exception as e:
             logger.error(f"Failed to load CoinGecko dataset: {e}")
@@ -311,54 +422,73 @@ class DatasetMerger:
         if len(self.datasets) == 0:
             raise ValueError("No datasets loaded - nothing to merge")
 
-        # Concatenate all datasets
-        logger.info(f"Concatenating {len(self.datasets)} datasets...")
-        combined = pd.concat(self.datasets, ignore_index=True)
+        # Merge one calendar month at a time: a (date, symbol) pair never spans months,
+        # so only one month of combined rows (and its sort copies) is in memory at once
+        logger.info(f"Merging {len(self.datasets)} datasets month by month...")
 
-        logger.info(f"  Total records before deduplication: {len(combined):,}")
+        # One shared symbol category set, so month slices concatenate as categoricals;
+        # symbols match case-insensitively (uppercased once per symbol, not per row)
+        symbols = self.datasets[0]['symbol'].cat.categories
+        for df in self.datasets[1:]:
+            symbols = symbols.union(df['symbol'].cat.categories)
+        for df in self.datasets:
+            df['symbol'] = df['symbol'].cat.set_categories(symbols)
+        symbol_keys = np.append(pd.factorize(symbols.str.upper())[0], -1)  # code -1 (no symbol) -> key -1
 
-        # Convert date to datetime for comparison
-        combined['date_parsed'] = pd.to_datetime(combined['date'])
+        month_indices = [build_month_index(df['date']) for df in self.datasets]
+        months = sorted(set().union(*month_indices))
 
-        # Normalize symbols (uppercase)
-        combined['symbol_normalized'] = combined['symbol'].str.upper()
+        total_records = sum(len(df) for df in self.datasets)
+        logger.info(f"  Total records before deduplication: {total_records:,} ({len(months)} months)")
+        logger.info("  Removing duplicates (date, symbol) - keeping highest priority source...")
 
-        # Sort by priority: quality_tier (verified first), then data_source
-        source_priority = {'kaggle': 1, 'crypto2': 2, 'coingecko': 3}
-        tier_priority = {'verified': 1, 'unverified': 2}
+        partitions = []
+        for month in months:
+            combined = pd.concat(
+                [df.iloc[index[month]] for df, index in zip(self.datasets, month_indices) if month in index],
+                ignore_index=True,
+            )
+            partitions.append(self._merge_partition(combined, symbol_keys))
 
-        combined['source_priority'] = combined['data_source'].map(source_priority)
-        combined['tier_priority'] = combined['quality_tier'].map(tier_priority)
+        # Columns in source order, whichever sources the first month happens to hold
+        columns = list(dict.fromkeys(col for df in self.datasets for col in df.columns))
+        merged = pd.concat(partitions, ignore_index=True).reindex(columns=columns)
 
-        combined = combined.sort_values(
-            ['tier_priority', 'source_priority', 'date_parsed', 'symbol_normalized']
-        )
+        duplicates_removed = total_records - len(merged)
+        logger.info(f"  Removed {duplicates_removed:,} duplicate records")
+        logger.info(f"  ✅ Final merged dataset: {len(merged):,} records")
 
-        # Remove duplicates: keep first (highest priority) for each (date, symbol)
-        logger.info("  Removing duplicates (date, symbol) - keeping highest priority source...")
+        self.merged_df = merged
+        return merged
 
-        before_dedup = len(combined)
-        combined = combined.drop_duplicates(
-            subset=['date_parsed', 'symbol_normalized'],
-            keep='first'
-        )
-        after_dedup = len(combined)
+    @classmethod
+    def _merge_partition(cls, combined: pd.DataFrame, symbol_keys: np.ndarray) -> pd.DataFrame:
+        """
+        Deduplicate one month of combined rows by source priority.
 
-        duplicates_removed = before_dedup - after_dedup
-        logger.info(f"  Removed {duplicates_removed:,} duplicate records")
+        Args:
+            combined: Rows from all sources for a single month
+            symbol_keys: Case-insensitive key per symbol category code (last entry for code -1)
 
-        # Drop helper columns
-        combined = combined.drop(columns=[
-            'date_parsed', 'symbol_normalized', 'source_priority', 'tier_priority'
-        ])
+        Returns:
+            One row per (date, symbol), sorted by date and rank
+        """
+        # Normalized symbol (uppercase), as an integer key
+        symbol_key = symbol_keys[combined['symbol'].cat.codes.to_numpy()]
 
-        # Sort by date and rank
-        combined = combined.sort_values(['date', 'rank'])
+        # One priority scalar per row from the category codes: quality_tier, then data_source
+        priority = (
+            combined['quality_tier'].cat.codes * len(cls.SOURCE_DTYPE.categories)
+            + combined['data_source'].cat.codes
+        ).astype('int8')
 
-        logger.info(f"  ✅ Final merged dataset: {len(combined):,} records")
+        # Remove duplicates: keep the highest priority row for each (date, symbol)
+        # (hash grouping; no sort of the combined rows)
+        keep = priority.groupby([combined['date'], symbol_key], sort=False, dropna=False).idxmin()
+        combined = combined.loc[keep]
 
-        self.merged_df = combined
-        return combined
+        # Sort by date and rank
+        return combined.sort_values(['date', 'rank'])
 
     def generate_metadata(self) -> Dict:
         """
@@ -373,16 +503,18 @@ class DatasetMerger:
         logger.info("Generating metadata...")
 
         # Quality tier distribution
-        quality_dist = self.merged_df['quality_tier'].value_counts().to_dict()
-        source_dist = self.merged_df['data_source'].value_counts().to_dict()
+        # (categorical value_counts lists every category; report only those present)
+        quality_dist = self.merged_df['quality_tier'].value_counts().loc[lambda counts: counts > 0].to_dict()
+        source_dist = self.merged_df['data_source'].value_counts().loc[lambda counts: counts > 0].to_dict()
 
+        date_min, date_max = format_date_range(self.merged_df['date'])
         self.metadata['quality_summary'] = {
             'total_records': len(self.merged_df),
             'quality_distribution': quality_dist,
             'source_distribution': source_dist,
             'date_range': {
-                'min': self.merged_df['date'].min(),
-                'max': self.merged_df['date'].max()
+                'min': date_min,
+                'max': date_max
             },
             'unique_coins': self.merged_df['symbol'].nunique(),
             'verified_percentage': (
@@ -397,12 +529,13 @@ class DatasetMerger:
 
         return self.metadata
 
-    def save_output(self, output_path: Path) -> None:
+    def save_output(self, output_path: Path, gzip_csv: bool = False) -> None:
         """
-        Save merged dataset and metadata.
+        Save merged dataset (CSV and Parquet) and metadata.
 
         Args:
-            output_path: Path for output CSV
+            output_path: Path for output CSV (Parquet and metadata are written alongside)
+            gzip_csv: Also write a gzip-compressed copy of the CSV (.csv.gz)
         """
         if self.merged_df is None:
             raise ValueError("No merged dataset to save")
@@ -418,14 +551,24 @@ class DatasetMerger:
         file_size_mb = output_path.stat().st_size / 1024 / 1024
         logger.info(f"  ✅ Saved {len(self.merged_df):,} records ({file_size_mb:.1f} MB)")
 
-        # Save compressed version
-        output_gz = output_path.with_suffix('.csv.gz')
-        logger.info(f"Saving compressed version to {output_gz}")
-        self.merged_df.to_csv(output_gz, index=False, compression='gzip')
+        # Save Parquet (typed, columnar; no text formatting pass)
+        output_parquet = output_path.with_suffix('.parquet')
+        logger.info(f"Saving Parquet version to {output_parquet}")
+        self.merged_df.to_parquet(output_parquet, engine='pyarrow', compression='snappy', index=False)
+
+        parquet_size_mb = output_parquet.stat().st_size / 1024 / 1024
+        logger.info(f"  ✅ Saved Parquet ({parquet_size_mb:.1f} MB)")
 
-        gz_size_mb = output_gz.stat().st_size / 1024 / 1024
-        compression_ratio = (1 - gz_size_mb / file_size_mb) * 100
-        logger.info(f"  ✅ Saved compressed ({gz_size_mb:.1f} MB, {compression_ratio:.0f}% smaller)")
+        # Save compressed version (gzips the CSV bytes just written; no second serialization)
+        if gzip_csv:
+            output_gz = output_path.with_suffix('.csv.gz')
+            logger.info(f"Saving compressed version to {output_gz}")
+            with open(output_path, 'rb') as src, gzip.open(output_gz, 'wb') as dst:
+                shutil.copyfileobj(src, dst, 1 << 20)
+
+            gz_size_mb = output_gz.stat().st_size / 1024 / 1024
+            compression_ratio = (1 - gz_size_mb / file_size_mb) * 100
+            logger.info(f"  ✅ Saved compressed ({gz_size_mb:.1f} MB, {compression_ratio:.0f}% smaller)")
 
         # Save metadata
         metadata_path = output_path.with_suffix('.json')
@@ -437,7 +580,7 @@ class DatasetMerger:
         logger.info("  ✅ Metadata saved")
 
     def run(self, kaggle_path: Optional[str], crypto2_path: Optional[str],
-            coingecko_path: Optional[str], output_path: str) -> bool:
+            coingecko_path: Optional[str], output_path: str, gzip_csv: bool = False) -> bool:
         """
         Run complete merge pipeline.
 
@@ -446,6 +589,7 @@ class DatasetMerger:
             crypto2_path: Path to crypto2 CSV (or 'none')
             coingecko_path: Path to CoinGecko CSV (or 'none')
             output_path: Output path for merged CSV
+            gzip_csv: Also write a gzip-compressed copy of the CSV
 
         Returns:
             True if successful
@@ -488,14 +632,16 @@ class DatasetMerger:
 
         # Save output
         output_path = Path(output_path)
-        self.save_output(output_path)
+        self.save_output(output_path, gzip_csv=gzip_csv)
 
         logger.info("")
         logger.info("="*70)
         logger.info("MERGE COMPLETE")
         logger.info("="*70)
         logger.info(f"Output: {output_path}")
-        logger.info(f"Compressed: {output_path.with_suffix('.csv.gz')}")
+        logger.info(f"Parquet: {output_path.with_suffix('.parquet')}")
+        if gzip_csv:
+            logger.info(f"Compressed: {output_path.with_suffix('.csv.gz')}")
         logger.info(f"Metadata: {output_path.with_suffix('.json')}")
         logger.info("")
         logger.info("NEXT STEPS:")
@@ -544,6 +690,11 @@ def main():
         default='data/final/crypto_historical_marketcap_ranked.csv',
         help='Output path for merged CSV'
     )
+    parser.add_argument(
+        '--gzip',
+        action='store_true',
+        help='Also write a gzip-compressed copy of the merged CSV (.csv.gz)'
+    )
     parser.add_argument(
         '--log-dir',
         default='logs',
@@ -573,7 +724,8 @@ def main():
             kaggle_path=args.kaggle,
             crypto2_path=args.crypto2,
             coingecko_path=args.coingecko,
-            output_path=args.output
+            output_path=args.output,
+            gzip_csv=args.gzip
         )
 
         logger.info(f"Log saved to: {log_file}")
@@ -1,12 +1,27 @@
 #!/usr/bin/env python3
 # /// script
-# dependencies = ["pandas>=2.0.0"]
+# dependencies = ["pyarrow>=14.0.0"]
 # ///
 """Quick analysis of crypto2 collected data."""
 
 import sys
 
-import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+from pyarrow import csv
+
+# Columns read from the CSV (any others are never converted). timestamp/symbol stay
+# strings (the date range prints the raw values); numeric columns are pinned to
+# float64 so a later block cannot contradict a type inferred from the first one.
+ANALYSIS_COLUMN_TYPES = {
+    'timestamp': pa.string(),
+    'symbol': pa.string(),
+    'price': pa.float64(),
+    'market_cap': pa.float64(),
+    'circulating_supply': pa.float64(),
+    'volume_24h': pa.float64(),
+}
 
 if len(sys.argv) < 2:
     print("Usage: uv run quick_analysis.py <csv_file>")
@@ -18,34 +33,48 @@ print("crypto2 Collection Analysis - Quick Summary")
 print(f"{'='*70}\n")
 print(f"File: {input_file}")
 
-df = pd.read_csv(input_file)
-print(f"✅ Loaded {len(df):,} records\n")
+# Scan only the analysed columns; every aggregation below runs in Arrow
+csv_format = ds.CsvFileFormat(
+    convert_options=csv.ConvertOptions(column_types=ANALYSIS_COLUMN_TYPES, strings_can_be_null=True)
+)
+dataset = ds.dataset(input_file, format=csv_format)
+columns = [col for col in ANALYSIS_COLUMN_TYPES if col in dataset.schema.names]
+table = dataset.to_table(columns=columns)
+print(f"✅ Loaded {table.num_rows:,} records\n")
 
 print("Column Completeness:")
-for col in ['timestamp', 'symbol', 'price', 'market_cap', 'circulating_supply', 'volume_24h']:
-    if col in df.columns:
-        non_null_pct = (df[col].notna().sum() / len(df)) * 100
-        print(f"  {col:20s}: {non_null_pct:6.2f}% present")
+present_pct = {}
+for col in columns:
+    present_pct[col] = ((table.num_rows - table[col].null_count) / table.num_rows) * 100
+    print(f"  {col:20s}: {present_pct[col]:6.2f}% present")
+
+# Records per coin, most first (stable sort: ties keep first-appearance order)
+symbol_counts = pc.value_counts(pc.drop_null(table['symbol']))
+coin_counts = pa.table({
+    'symbol': symbol_counts.field('values'),
+    'count': symbol_counts.field('counts'),
+}).sort_by([('count', 'descending')])
 
+date_range = pc.min_max(table['timestamp']).as_py()
 print("\nData Summary:")
-print(f"  Unique coins: {df['symbol'].nunique()}")
-print(f"  Date range: {df['timestamp'].min()} to {df['timestamp'].max()}")
+print(f"  Unique coins: {coin_counts.num_rows}")
+print(f"  Date range: {date_range['min']} to {date_range['max']}")
 
 # Top 10 coins by record count
 print("\nTop 10 Coins by Record Count:")
-top_coins = df['symbol'].value_counts().head(10)
-for symbol, count in top_coins.items():
+top_coins = coin_counts.slice(0, 10)
+for symbol, count in zip(top_coins['symbol'].to_pylist(), top_coins['count'].to_pylist()):
     print(f"  {symbol:10s}: {count:,} records")
 
 # Bottom 10 coins by record count
 print("\nBottom 10 Coins by Record Count:")
-bottom_coins = df['symbol'].value_counts().tail(10)
-for symbol, count in bottom_coins.items():
+bottom_coins = coin_counts.slice(max(coin_counts.num_rows - 10, 0))
+for symbol, count in zip(bottom_coins['symbol'].to_pylist(), bottom_coins['count'].to_pylist()):
     print(f"  {symbol:10s}: {count:,} records")
 
 # Check for circulating_supply presence
-if 'circulating_supply' in df.columns:
-    supply_pct = (df['circulating_supply'].notna().sum() / len(df)) * 100
+if 'circulating_supply' in present_pct:
+    supply_pct = present_pct['circulating_supply']
     if supply_pct >= 95:
         print(f"\n✅ Excellent: {supply_pct:.1f}% of records have circulating_supply")
     elif supply_pct >= 75:
@@ -53,11 +82,10 @@ if 'circulating_supply' in df.columns:
     else:
         print(f"\n⚠️  Warning: Only {supply_pct:.1f}% of records have circulating_supply")
 
-# Check all collected coins
-print(f"\n\nAll {df['symbol'].nunique()} Collected Coins:")
-all_coins = sorted(df['symbol'].unique())
-for i, coin in enumerate(all_coins, 1):
-    coin_records = (df['symbol'] == coin).sum()
-    print(f"  {i:2d}. {coin:10s} ({coin_records:,} records)")
+# Check all collected coins (record counts reused from value_counts above)
+print(f"\n\nAll {coin_counts.num_rows} Collected Coins:")
+records = dict(zip(coin_counts['symbol'].to_pylist(), coin_counts['count'].to_pylist()))
+for i, coin in enumerate(sorted(records), 1):
+    print(f"  {i:2d}. {coin:10s} ({records[coin]:,} records)")
 
 print(f"\n{'='*70}\n")
@@ -19,6 +19,7 @@ import time
 from datetime import datetime
 
 import requests
+from requests.adapters import HTTPAdapter
 
 
 def test_no_api_key_collection(delay_seconds: float, num_coins: int = 20):
@@ -38,12 +39,18 @@ def test_no_api_key_collection(delay_seconds: float, num_coins: int = 20):
     print(f"Estimated time: {(num_coins * delay_seconds / 60):.1f} minutes")
     print()
 
+    # One keep-alive connection for every probe (TCP/TLS handshake once). No automatic
+    # retries: each request must be counted exactly once, 429s included.
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+    session.headers["User-Agent"] = "crypto-marketcap-rank (tools/test_no_api_key_threshold.py)"
+
     # Get top N coins
     print("Step 1: Getting coin list...")
     base_url = "https://api.coingecko.com/api/v3"
 
     try:
-        response = requests.get(
+        response = session.get(
             f"{base_url}/coins/markets",
             params={
                 'vs_currency': 'usd',
@@ -85,7 +92,7 @@ def test_no_api_key_collection(delay_seconds: float, num_coins: int = 20):
             time.sleep(delay_seconds)
 
         try:
-            response = requests.get(
+            response = session.get(
                 f"{base_url}/coins/{coin_id}/market_chart",
                 params={
                     'vs_currency': 'usd',